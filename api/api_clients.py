@@ -7,6 +7,7 @@ This module provides direct HTTP-based API clients for external services:
 
 Key Features:
     - Direct HTTP requests using aiohttp for async operations
+    - One shared, pooled aiohttp session reused across calls
     - Comprehensive error handling and logging
     - API key injection for secure communication
     - Support for all Paradigm API endpoints (search, analysis, file operations)
@@ -26,12 +27,72 @@ Usage:
 import aiohttp
 import asyncio
 import logging
-from typing import Optional, List, Dict, Any
+import orjson
+from typing import Optional, List, Dict, Any, BinaryIO, Union
 from .config import settings
 
 # Set up logging for detailed API call tracking
 logger = logging.getLogger(__name__)
 
+# Uploads are streamed and can take arbitrarily long overall, so only bound
+# the time between reads rather than the whole request
+_UPLOAD_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_read=120)
+
+# ============================================================================
+# SHARED HTTP SESSION
+# ============================================================================
+
+# One pooled session for all outbound calls, so keep-alive connections and
+# TLS sessions are reused instead of re-established on every request
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+async def _discard_session(session: aiohttp.ClientSession, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """
+    Close a session that may belong to another event loop.
+    
+    If its loop is still running (e.g. in another thread) the session is closed
+    there; otherwise it is closed from the current loop, which releases the
+    connector and marks the session closed even if its old loop is gone.
+    """
+    if session.closed:
+        return
+    try:
+        if loop is not None and loop is not asyncio.get_running_loop() and loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            await session.close()
+    except Exception as e:
+        logger.warning("Failed to close stale aiohttp session: %s", e)
+
+async def _get_session() -> aiohttp.ClientSession:
+    """
+    Return the shared aiohttp session, creating it on first use.
+    
+    A new session is created if the previous one was closed or belongs to
+    another event loop (e.g. serverless runtimes that start a loop per request);
+    a session left behind by another loop is closed before it is replaced.
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        if _session is not None:
+            await _discard_session(_session, _session_loop)
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=30),
+            json_serialize=lambda obj: orjson.dumps(obj).decode()
+        )
+        _session_loop = loop
+    return _session
+
+async def close_session() -> None:
+    """Close the shared aiohttp session, if one is open."""
+    global _session, _session_loop
+    if _session is not None:
+        await _discard_session(_session, _session_loop)
+    _session = None
+    _session_loop = None
+
 # ============================================================================
 # ANTHROPIC CLAUDE API CLIENT (Direct HTTP)
 # ============================================================================
@@ -107,18 +168,18 @@ Return only the Python code, no explanations or markdown formatting."""
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                "https://api.anthropic.com/v1/messages",
-                json=payload,
-                headers=headers
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result["content"][0]["text"]
-                else:
-                    error_text = await response.text()
-                    raise Exception(f"Anthropic API error {response.status}: {error_text}")
+        session = await _get_session()
+        async with session.post(
+            "https://api.anthropic.com/v1/messages",
+            json=payload,
+            headers=headers
+        ) as response:
+            if response.status == 200:
+                result = orjson.loads(await response.read())
+                return result["content"][0]["text"]
+            else:
+                error_text = await response.text()
+                raise Exception(f"Anthropic API error {response.status}: {error_text}")
     except Exception as e:
         raise Exception(f"Failed to generate code: {str(e)}")
 
@@ -154,18 +215,18 @@ async def anthropic_chat_completion(prompt: str, system_prompt: Optional[str] =
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                "https://api.anthropic.com/v1/messages",
-                json=payload,
-                headers=headers
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result["content"][0]["text"]
-                else:
-                    error_text = await response.text()
-                    raise Exception(f"Anthropic API error {response.status}: {error_text}")
+        session = await _get_session()
+        async with session.post(
+            "https://api.anthropic.com/v1/messages",
+            json=payload,
+            headers=headers
+        ) as response:
+            if response.status == 200:
+                result = orjson.loads(await response.read())
+                return result["content"][0]["text"]
+            else:
+                error_text = await response.text()
+                raise Exception(f"Anthropic API error {response.status}: {error_text}")
     except Exception as e:
         raise Exception(f"Chat completion failed: {str(e)}")
 
@@ -249,37 +310,37 @@ async def paradigm_document_search(
         logger.info(f"🔍 QUERY: {query}")
         logger.info(f"📋 PAYLOAD: {payload}")
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                endpoint,
-                json=payload,
-                headers=_get_paradigm_headers()
-            ) as response:
-                response_text = await response.text()
-                logger.info(f"📥 RAW RESPONSE: Status {response.status}, Body: {response_text[:500]}...")
+        session = await _get_session()
+        async with session.post(
+            endpoint,
+            json=payload,
+            headers=_get_paradigm_headers()
+        ) as response:
+            response_text = await response.text()
+            logger.info(f"📥 RAW RESPONSE: Status {response.status}, Body: {response_text[:500]}...")
+            
+            if response.status == 200:
+                result = orjson.loads(await response.read())
+                # Log response details
+                doc_count = len(result.get("documents", []))
+                logger.info(f"✅ SEARCH SUCCESS: Found {doc_count} documents")
+                logger.info(f"💬 ANSWER: {result.get('answer', 'No answer')[:300]}...")
                 
-                if response.status == 200:
-                    result = await response.json()
-                    # Log response details
-                    doc_count = len(result.get("documents", []))
-                    logger.info(f"✅ SEARCH SUCCESS: Found {doc_count} documents")
-                    logger.info(f"💬 ANSWER: {result.get('answer', 'No answer')[:300]}...")
-                    
-                    # Log document IDs and chunks
-                    if result.get("documents"):
-                        doc_ids = [str(doc.get("id", "unknown")) for doc in result.get("documents", [])]
-                        logger.info(f"📋 DOCUMENT IDS: {', '.join(doc_ids)}")
-                        
-                        # Log document chunks in detail
-                        for i, doc in enumerate(result.get("documents", [])[:3]):  # First 3 docs
-                            logger.info(f"📄 DOCUMENT {i+1}: ID={doc.get('id')}, Title={doc.get('title', 'Untitled')[:50]}...")
-                            if 'chunks' in doc:
-                                logger.info(f"📄 DOC {i+1} CHUNKS: {len(doc['chunks'])} chunks")
+                # Log document IDs and chunks
+                if result.get("documents"):
+                    doc_ids = [str(doc.get("id", "unknown")) for doc in result.get("documents", [])]
+                    logger.info(f"📋 DOCUMENT IDS: {', '.join(doc_ids)}")
                     
-                    return result
-                else:
-                    logger.error(f"❌ PARADIGM SEARCH API ERROR: {response.status} - {response_text}")
-                    raise Exception(f"Paradigm document search API error {response.status}: {response_text}")
+                    # Log document chunks in detail
+                    for i, doc in enumerate(result.get("documents", [])[:3]):  # First 3 docs
+                        logger.info(f"📄 DOCUMENT {i+1}: ID={doc.get('id')}, Title={doc.get('title', 'Untitled')[:50]}...")
+                        if 'chunks' in doc:
+                            logger.info(f"📄 DOC {i+1} CHUNKS: {len(doc['chunks'])} chunks")
+                
+                return result
+            else:
+                logger.error(f"❌ PARADIGM SEARCH API ERROR: {response.status} - {response_text}")
+                raise Exception(f"Paradigm document search API error {response.status}: {response_text}")
     
     except aiohttp.ClientError as e:
         logger.error(f"❌ NETWORK ERROR: {str(e)}")
@@ -334,21 +395,21 @@ async def paradigm_document_analysis(
         logger.info(f"📋 DOCUMENT IDS: {document_ids}")
         logger.info(f"📋 PAYLOAD: {payload}")
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                endpoint,
-                json=payload,
-                headers=_get_paradigm_headers()
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    chat_response_id = result.get("chat_response_id")
-                    logger.info(f"✅ ANALYSIS STARTED: chat_response_id = {chat_response_id}")
-                    return result
-                else:
-                    error_text = await response.text()
-                    logger.error(f"❌ PARADIGM ANALYSIS API ERROR: {response.status} - {error_text}")
-                    raise Exception(f"Paradigm document analysis API error {response.status}: {error_text}")
+        session = await _get_session()
+        async with session.post(
+            endpoint,
+            json=payload,
+            headers=_get_paradigm_headers()
+        ) as response:
+            if response.status == 200:
+                result = orjson.loads(await response.read())
+                chat_response_id = result.get("chat_response_id")
+                logger.info(f"✅ ANALYSIS STARTED: chat_response_id = {chat_response_id}")
+                return result
+            else:
+                error_text = await response.text()
+                logger.error(f"❌ PARADIGM ANALYSIS API ERROR: {response.status} - {error_text}")
+                raise Exception(f"Paradigm document analysis API error {response.status}: {error_text}")
     
     except aiohttp.ClientError as e:
         logger.error(f"❌ NETWORK ERROR: {str(e)}")
@@ -379,18 +440,18 @@ async def paradigm_get_analysis_result(chat_response_id: int) -> Dict[str, Any]:
     endpoint = f"{settings.lighton_base_url}/api/v2/chat/document-analysis/{chat_response_id}"
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                endpoint,
-                headers=_get_paradigm_headers()
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                elif response.status == 404:
-                    raise Exception(f"Analysis result not found for ID {chat_response_id}")
-                else:
-                    error_text = await response.text()
-                    raise Exception(f"Paradigm get analysis result API error {response.status}: {error_text}")
+        session = await _get_session()
+        async with session.get(
+            endpoint,
+            headers=_get_paradigm_headers()
+        ) as response:
+            if response.status == 200:
+                return orjson.loads(await response.read())
+            elif response.status == 404:
+                raise Exception(f"Analysis result not found for ID {chat_response_id}")
+            else:
+                error_text = await response.text()
+                raise Exception(f"Paradigm get analysis result API error {response.status}: {error_text}")
     
     except aiohttp.ClientError as e:
         raise Exception(f"Network error calling Paradigm get analysis result API: {str(e)}")
@@ -403,10 +464,15 @@ async def paradigm_analyze_documents_with_polling(
     model: Optional[str] = None,
     private: bool = False,
     max_wait_time: int = 300,
-    poll_interval: int = 5
+    poll_interval: float = 0.5,
+    max_poll_interval: float = 10.0
 ) -> str:
     """
     Perform document analysis and poll for results until completion via direct HTTP
+    
+    The wait between polls starts at poll_interval and grows by 1.5x up to
+    max_poll_interval, so short analyses return quickly and long ones are
+    not polled needlessly often.
     """
     try:
         logger.info(f"📊 STARTING DOCUMENT ANALYSIS WITH POLLING")
@@ -436,7 +502,7 @@ async def paradigm_analyze_documents_with_polling(
                 status = result.get("status", "")
                 progress = result.get("progress", "")
                 
-                logger.info(f"📊 POLLING STATUS: {status} | Progress: {progress} | Elapsed: {elapsed_time}s")
+                logger.info(f"📊 POLLING STATUS: {status} | Progress: {progress} | Elapsed: {elapsed_time:.1f}s")
                 
                 if status.lower() in ["completed", "complete", "finished", "success"]:
                     # Analysis is complete, return the result
@@ -453,13 +519,15 @@ async def paradigm_analyze_documents_with_polling(
                 # Still processing, wait and try again
                 await asyncio.sleep(poll_interval)
                 elapsed_time += poll_interval
+                poll_interval = min(poll_interval * 1.5, max_poll_interval)
                 
             except Exception as e:
                 if "not found" in str(e).lower():
                     # Continue polling if result not ready yet
-                    logger.info(f"⏳ RESULT NOT READY: Continuing to poll... ({elapsed_time}s)")
+                    logger.info(f"⏳ RESULT NOT READY: Continuing to poll... ({elapsed_time:.1f}s)")
                     await asyncio.sleep(poll_interval)
                     elapsed_time += poll_interval
+                    poll_interval = min(poll_interval * 1.5, max_poll_interval)
                     continue
                 else:
                     logger.error(f"❌ POLLING ERROR: {str(e)}")
@@ -471,19 +539,24 @@ async def paradigm_analyze_documents_with_polling(
         return f"Document analysis failed: {str(e)}"
 
 async def paradigm_upload_file(
-    file_content: bytes,
+    fileobj: Union[bytes, BinaryIO],
     filename: str,
     collection_type: str = "private",
-    workspace_id: Optional[int] = None
+    workspace_id: Optional[int] = None,
+    content_type: str = "application/octet-stream"
 ) -> Dict[str, Any]:
     """
     Upload a file to Paradigm for analysis via direct HTTP
+    
+    Accepts either raw bytes or a readable file object. File objects are
+    streamed by aiohttp in chunks, so large uploads are never fully loaded
+    into memory.
     """
     endpoint = f"{settings.lighton_base_url}/api/v2/files"
     
     # Prepare multipart form data
     data = aiohttp.FormData()
-    data.add_field('file', file_content, filename=filename, content_type='application/octet-stream')
+    data.add_field('file', fileobj, filename=filename, content_type=content_type)
     data.add_field('collection_type', collection_type)
     if workspace_id:
         data.add_field('workspace_id', str(workspace_id))
@@ -496,23 +569,25 @@ async def paradigm_upload_file(
         logger.info(f"📁 PARADIGM API CALL: File Upload")
         logger.info(f"📡 ENDPOINT: {endpoint}")
         logger.info(f"📄 FILENAME: {filename}")
-        logger.info(f"📦 FILE SIZE: {len(file_content)} bytes")
+        if isinstance(fileobj, bytes):
+            logger.info(f"📦 FILE SIZE: {len(fileobj)} bytes")
         logger.info(f"🗂️ COLLECTION TYPE: {collection_type}")
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                endpoint,
-                data=data,
-                headers=headers
-            ) as response:
-                if response.status == 201:
-                    result = await response.json()
-                    logger.info(f"✅ UPLOAD SUCCESS: File ID = {result.get('id')}, Status = {result.get('status')}")
-                    return result
-                else:
-                    error_text = await response.text()
-                    logger.error(f"❌ PARADIGM UPLOAD API ERROR: {response.status} - {error_text}")
-                    raise Exception(f"Paradigm file upload API error {response.status}: {error_text}")
+        session = await _get_session()
+        async with session.post(
+            endpoint,
+            data=data,
+            headers=headers,
+            timeout=_UPLOAD_TIMEOUT
+        ) as response:
+            if response.status == 201:
+                result = orjson.loads(await response.read())
+                logger.info(f"✅ UPLOAD SUCCESS: File ID = {result.get('id')}, Status = {result.get('status')}")
+                return result
+            else:
+                error_text = await response.text()
+                logger.error(f"❌ PARADIGM UPLOAD API ERROR: {response.status} - {error_text}")
+                raise Exception(f"Paradigm file upload API error {response.status}: {error_text}")
     
     except aiohttp.ClientError as e:
         logger.error(f"❌ NETWORK ERROR: {str(e)}")
@@ -530,18 +605,18 @@ async def paradigm_get_file_info(file_id: int, include_content: bool = False) ->
         endpoint += "?include_content=true"
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                endpoint,
-                headers=_get_paradigm_headers()
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                elif response.status == 404:
-                    raise Exception(f"File not found: {file_id}")
-                else:
-                    error_text = await response.text()
-                    raise Exception(f"Paradigm get file info API error {response.status}: {error_text}")
+        session = await _get_session()
+        async with session.get(
+            endpoint,
+            headers=_get_paradigm_headers()
+        ) as response:
+            if response.status == 200:
+                return orjson.loads(await response.read())
+            elif response.status == 404:
+                raise Exception(f"File not found: {file_id}")
+            else:
+                error_text = await response.text()
+                raise Exception(f"Paradigm get file info API error {response.status}: {error_text}")
     
     except aiohttp.ClientError as e:
         raise Exception(f"Network error calling Paradigm get file info API: {str(e)}")
@@ -559,17 +634,17 @@ async def paradigm_ask_question_about_file(file_id: int, question: str) -> Dict[
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                endpoint,
-                json=payload,
-                headers=_get_paradigm_headers()
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    error_text = await response.text()
-                    raise Exception(f"Paradigm ask question API error {response.status}: {error_text}")
+        session = await _get_session()
+        async with session.post(
+            endpoint,
+            json=payload,
+            headers=_get_paradigm_headers()
+        ) as response:
+            if response.status == 200:
+                return orjson.loads(await response.read())
+            else:
+                error_text = await response.text()
+                raise Exception(f"Paradigm ask question API error {response.status}: {error_text}")
     
     except aiohttp.ClientError as e:
         raise Exception(f"Network error calling Paradigm ask question API: {str(e)}")
@@ -583,19 +658,19 @@ async def paradigm_delete_file(file_id: int) -> bool:
     endpoint = f"{settings.lighton_base_url}/api/v2/files/{file_id}"
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.delete(
-                endpoint,
-                headers=_get_paradigm_headers()
-            ) as response:
-                if response.status == 200:
-                    return True
-                elif response.status == 404:
-                    logger.warning(f"File not found for deletion: {file_id}")
-                    return False
-                else:
-                    error_text = await response.text()
-                    raise Exception(f"Paradigm delete file API error {response.status}: {error_text}")
+        session = await _get_session()
+        async with session.delete(
+            endpoint,
+            headers=_get_paradigm_headers()
+        ) as response:
+            if response.status == 200:
+                return True
+            elif response.status == 404:
+                logger.warning(f"File not found for deletion: {file_id}")
+                return False
+            else:
+                error_text = await response.text()
+                raise Exception(f"Paradigm delete file API error {response.status}: {error_text}")
     
     except aiohttp.ClientError as e:
         raise Exception(f"Network error calling Paradigm delete file API: {str(e)}")
@@ -633,8 +708,8 @@ class MockParadigmClient:
     async def analyze_documents_with_polling(self, query: str, document_ids: List[str], **kwargs) -> str:
         return await paradigm_analyze_documents_with_polling(query, document_ids, **kwargs)
     
-    async def upload_file(self, file_content: bytes, filename: str, **kwargs) -> Dict[str, Any]:
-        return await paradigm_upload_file(file_content, filename, **kwargs)
+    async def upload_file(self, fileobj: Union[bytes, BinaryIO], filename: str, **kwargs) -> Dict[str, Any]:
+        return await paradigm_upload_file(fileobj, filename, **kwargs)
     
     async def get_file_info(self, file_id: int, **kwargs) -> Dict[str, Any]:
         return await paradigm_get_file_info(file_id, **kwargs)
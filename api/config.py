@@ -10,6 +10,11 @@ Environment Variables:
     DEBUG: Enable debug mode (true/false)
     HOST: Server host address (default: 0.0.0.0)
     PORT: Server port number (default: 8000)
+    WORKERS: Number of server worker processes (default: 1)
+    ANTHROPIC_MAX_CONCURRENCY: Concurrent Anthropic requests per process (default: 8)
+    GENERATOR_MODEL: Claude model for workflow code generation (default: claude-haiku-4-5)
+    GENERATOR_FALLBACK_MODEL: Model retried once when generated code fails validation
+        (default: claude-sonnet-4-20250514)
 
 Features:
     - Environment variable loading via python-dotenv
@@ -19,37 +24,73 @@ Features:
 """
 
 import os
-from typing import Optional
+from dataclasses import dataclass
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+@dataclass(frozen=True, slots=True)
 class Settings:
     """
     Application settings configuration class.
     
     Loads configuration from environment variables and provides validation.
     All settings have sensible defaults and can be overridden via environment variables.
+    Instances are immutable; build them with Settings.from_env().
     """
     
-    def __init__(self):
-        # Core API keys - required for operation
-        self.anthropic_api_key: str = os.getenv("ANTHROPIC_API_KEY", "")
-        self.lighton_api_key: str = os.getenv("LIGHTON_API_KEY", "")
-        
-        # Server configuration
-        self.debug: bool = os.getenv("DEBUG", "false").lower() == "true"
-        self.host: str = os.getenv("HOST", "0.0.0.0")
-        self.port: int = int(os.getenv("PORT", "8000"))
-        
-        # LightOn Paradigm API settings
-        self.lighton_base_url: str = "https://paradigm.lighton.ai"
-        self.lighton_docsearch_endpoint: str = "/api/v2/chat/document-search"
+    # Core API keys - required for operation
+    anthropic_api_key: str = ""
+    lighton_api_key: str = ""
+    
+    # Server configuration
+    debug: bool = False
+    host: str = "0.0.0.0"
+    port: int = 8000
+    # Workflows, executions and caches are held in process memory, so with
+    # more than one worker each process has its own store
+    workers: int = 1
+    
+    # LightOn Paradigm API settings
+    lighton_base_url: str = "https://paradigm.lighton.ai"
+    lighton_docsearch_endpoint: str = "/api/v2/chat/document-search"
+    
+    # Anthropic request flow control
+    anthropic_max_concurrency: int = 8
+    
+    # Code generation models: a fast default, and a stronger fallback used
+    # when the default's output fails validation.
+    # Note: the code-generation system prompt (~3.6k tokens) is below Haiku
+    # 4.5's 4096-token minimum for prompt caching, so its cache_control only
+    # takes effect on the fallback (Sonnet 4 caches from 1024 tokens).
+    generator_model: str = "claude-haiku-4-5"
+    generator_fallback_model: str = "claude-sonnet-4-20250514"
+    
+    # Workflow execution settings
+    max_execution_time: int = 1800  # 20 minutes maximum execution time
+    max_workflow_steps: int = 50   # Maximum number of workflow steps
+    
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """
+        Build settings from environment variables, read once.
         
-        # Workflow execution settings
-        self.max_execution_time: int = 1800  # 20 minutes maximum execution time
-        self.max_workflow_steps: int = 50   # Maximum number of workflow steps
+        Returns:
+            Settings: Immutable settings instance
+        """
+        env = os.environ
+        return cls(
+            anthropic_api_key=env.get("ANTHROPIC_API_KEY", ""),
+            lighton_api_key=env.get("LIGHTON_API_KEY", ""),
+            debug=env.get("DEBUG", "false").lower() == "true",
+            host=env.get("HOST", "0.0.0.0"),
+            port=int(env.get("PORT", "8000")),
+            workers=int(env.get("WORKERS", "1")),
+            anthropic_max_concurrency=int(env.get("ANTHROPIC_MAX_CONCURRENCY", "8")),
+            generator_model=env.get("GENERATOR_MODEL", "claude-haiku-4-5"),
+            generator_fallback_model=env.get("GENERATOR_FALLBACK_MODEL", "claude-sonnet-4-20250514"),
+        )
         
     def validate(self) -> None:
         """
@@ -64,4 +105,4 @@ class Settings:
             raise ValueError("LIGHTON_API_KEY is required")
 
 # Global settings instance - used throughout the application
-settings = Settings()
\ No newline at end of file
+settings = Settings.from_env()
\ No newline at end of file
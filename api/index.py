@@ -1 +1,14 @@
-from .main import app
\ No newline at end of file
+"""
+Vercel Serverless Entry Point
+
+Exposes the FastAPI application for the @vercel/python runtime.
+Kept free of any module-level work beyond the import so cold starts only
+pay for loading the application itself.
+"""
+# Absolute import on purpose: a launcher that loads this file by path under its
+# own module name leaves no parent package for a relative ".main" import. The
+# project root (the function's working directory) is on sys.path, so "api" is
+# importable both there and when imported as api.index locally.
+from api.main import app
+
+handler = app
@@ -27,25 +27,31 @@ and provides comprehensive API documentation via FastAPI's automatic OpenAPI int
 """
 
 import asyncio
+import importlib
 import logging
+import time
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Optional, Dict, Any
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Body
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Body, BackgroundTasks, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
-import uvicorn
+import orjson
 
 from .config import settings
+from .responses import ORJSONResponse
 from .models import (
     WorkflowCreateRequest,
     WorkflowExecuteRequest,
     WorkflowCodeExecuteRequest,
     WorkflowResponse,
     WorkflowExecutionResponse,
-    ErrorResponse,
     FileUploadResponse,
     FileInfoResponse,
     FileQuestionRequest,
@@ -58,10 +64,7 @@ from .models import (
     AutomatedTestResponse,
     TestResult,
 )
-from .workflow.generator import workflow_generator
-from .workflow.executor import workflow_executor
-from .workflow.models import Workflow, WorkflowExecution, ExecutionStatus
-from .api_clients import paradigm_client  # Updated import
+from .workflow.models import Workflow, WorkflowExecution, WorkflowStatus
 
 # Configure logging based on debug settings
 logging.basicConfig(level=logging.INFO if settings.debug else logging.WARNING)
@@ -71,6 +74,17 @@ logger = logging.getLogger(__name__)
 session_test_examples: Dict[str, List[TestExample]] = {}
 
 # API key validation helpers
+# API keys come from the environment and never change after startup, so the
+# 503 errors for missing keys are built once and reused by every request.
+_ANTHROPIC_KEY_MISSING = None if settings.anthropic_api_key else HTTPException(
+    status_code=503,
+    detail="Anthropic API key not configured. Please set ANTHROPIC_API_KEY environment variable."
+)
+_LIGHTON_KEY_MISSING = None if settings.lighton_api_key else HTTPException(
+    status_code=503,
+    detail="LightOn API key not configured. Please set LIGHTON_API_KEY environment variable."
+)
+
 def validate_anthropic_api_key():
     """
     Validate that Anthropic API key is available.
@@ -81,11 +95,9 @@ def validate_anthropic_api_key():
     Raises:
         HTTPException: 503 if API key is missing
     """
-    if not settings.anthropic_api_key:
-        raise HTTPException(
-            status_code=503,
-            detail="Anthropic API key not configured. Please set ANTHROPIC_API_KEY environment variable."
-        )
+    if _ANTHROPIC_KEY_MISSING:
+        # Drop the previous traceback so re-raising the shared instance doesn't grow it
+        raise _ANTHROPIC_KEY_MISSING.with_traceback(None)
     return True
 
 def validate_lighton_api_key():
@@ -98,47 +110,131 @@ def validate_lighton_api_key():
     Raises:
         HTTPException: 503 if API key is missing
     """
-    if not settings.lighton_api_key:
-        raise HTTPException(
-            status_code=503,
-            detail="LightOn API key not configured. Please set LIGHTON_API_KEY environment variable."
-        )
+    if _LIGHTON_KEY_MISSING:
+        # Drop the previous traceback so re-raising the shared instance doesn't grow it
+        raise _LIGHTON_KEY_MISSING.with_traceback(None)
     return True
 
+def _utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string without building a datetime."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
+
+# Lazily imported service singletons.
+# The generator pulls in the Anthropic SDK and the clients pull in aiohttp, so
+# they are only imported on first use. This keeps serverless cold starts and
+# lightweight routes (frontend, health check) free of that import cost.
+@lru_cache(maxsize=None)
+def _get_generator():
+    """Return the shared workflow generator, creating it on first use."""
+    from .workflow.generator import WorkflowGenerator
+    return WorkflowGenerator()
+
+@lru_cache(maxsize=None)
+def _get_executor():
+    """Return the shared workflow executor, importing it on first use."""
+    from .workflow.executor import workflow_executor
+    return workflow_executor
+
+@lru_cache(maxsize=None)
+def _get_paradigm_client():
+    """Return the shared Paradigm API client, importing it on first use."""
+    from .api_clients import paradigm_client
+    return paradigm_client
+
+def _warn_on_missing_api_keys() -> None:
+    """
+    Log missing API keys at startup.
+    
+    Endpoints still answer with 503 when a key is missing, but operators
+    see the misconfiguration at boot rather than on the first request.
+    """
+    if _ANTHROPIC_KEY_MISSING:
+        logger.warning("ANTHROPIC_API_KEY is not set - workflow generation endpoints will return 503")
+    if _LIGHTON_KEY_MISSING:
+        logger.warning("LIGHTON_API_KEY is not set - file endpoints will return 503")
+
+def _warm_service_imports() -> None:
+    """
+    Import the lazily-loaded service modules so they are cached in sys.modules.
+    
+    Only the modules are imported here. The services themselves are still
+    created by the getters on the event loop, so a request racing the
+    warm-up can never build a second generator.
+    """
+    importlib.import_module(".workflow.generator", __package__)
+    importlib.import_module(".workflow.executor", __package__)
+    importlib.import_module(".api_clients", __package__)
+
+async def _warm_services() -> None:
+    """Run the import warm-up in a worker thread, logging but ignoring failures."""
+    try:
+        await asyncio.to_thread(_warm_service_imports)
+    except Exception as e:
+        logger.warning("Service warm-up failed: %s", e)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Own the application's startup and shutdown.
+    
+    On startup, reports missing API keys and starts importing the heavy
+    service modules without delaying startup, so the first workflow or file
+    request doesn't pay for them. On shutdown, closes the Anthropic client's
+    connection pool and the shared Paradigm HTTP session if they were created.
+    
+    Services are still created lazily by the getters above, so requests
+    work even on runtimes that skip the lifespan protocol.
+    """
+    _warn_on_missing_api_keys()
+    warmup_task = asyncio.create_task(_warm_services())
+    try:
+        yield
+    finally:
+        if not warmup_task.done():
+            warmup_task.cancel()
+        if _get_generator.cache_info().currsize:
+            await _get_generator().close()
+        if _get_paradigm_client.cache_info().currsize:
+            from .api_clients import close_session
+            await close_session()
+
 # Create FastAPI app with comprehensive metadata
 app = FastAPI(
     title="Workflow Automation API",
     description="API for creating and executing automated workflows using AI",
     version="1.0.0",
-    debug=settings.debug
+    debug=settings.debug,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Create API router with /api prefix
 from fastapi import APIRouter
 api_router = APIRouter()
 
-# Add CORS middleware for cross-domain frontend support
+# Add CORS middleware for cross-domain frontend support.
+# Known origins (local development, the production frontend) are matched
+# literally before the regex is tried. Starlette matches allow_origins
+# literally, so wildcard hosts are expressed as a single regex (compiled once
+# at startup) for Vercel, Netlify, GitHub Pages, Surge and Firebase deployments.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
-        "http://localhost:3000",  # Local development
+        "http://localhost:3000",
         "http://127.0.0.1:3000",
-        "https://scaffold-ai-test2.vercel.app",  # Production frontend
-        "https://scaffold-ai-test2-milo-rignells-projects.vercel.app",  # Your current deployment
-        "https://scaffold-ai-test2-fi4dvy1xl-milo-rignells-projects.vercel.app",
-        "https://scaffold-ai-test2-tawny.vercel.app",  # Your other deployment
-        "https://scaffold-ai-test2-git-main-milo-rignells-projects.vercel.app/",
-        "https://*.vercel.app",  # All Vercel deployments
-        "https://*.netlify.app",  # Netlify deployments
-        "https://*.github.io",   # GitHub Pages
-        "https://*.surge.sh",    # Surge deployments
-        "https://*.firebaseapp.com"  # Firebase hosting
+        "https://scaffold-ai-test2.vercel.app",
     ],
+    allow_origin_regex=r"^https://([a-z0-9-]+\.)*(vercel\.app|netlify\.app|github\.io|surge\.sh|firebaseapp\.com)$",
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
+    allow_headers=["Content-Type", "Authorization", "Accept"],
+    max_age=86400,  # Let browsers cache preflight responses for 24h
 )
 
+# Compress large responses (generated code, file content, the frontend HTML).
+# Small bodies such as health checks and preflights stay below minimum_size.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 @app.get("/", response_class=HTMLResponse, tags=["Frontend"])
 async def serve_frontend():
@@ -149,15 +245,15 @@ async def serve_frontend():
     """
     try:
         # Try to read the index.html file from the project root
-        with open("index.html", "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
+        content = await asyncio.to_thread(Path("index.html").read_text, encoding="utf-8")
+        return HTMLResponse(content=content)
     except FileNotFoundError:
         # Fallback to API info if index.html not found
         return {
             "message": "Workflow Automation API",
             "version": "1.0.0", 
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
             "note": "Frontend file not found - API only mode"
         }
 
@@ -170,8 +266,8 @@ async def serve_file_mode_frontend():
     """
     try:
         # Try to read the file-workflow.html file from the project root
-        with open("file-workflow.html", "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
+        content = await asyncio.to_thread(Path("file-workflow.html").read_text, encoding="utf-8")
+        return HTMLResponse(content=content)
     except FileNotFoundError:
         # Fallback if file-workflow.html not found
         return HTMLResponse(
@@ -185,8 +281,7 @@ async def serve_lighton_logo():
     Serve the LightOn logo image.
     """
     try:
-        with open("lighton-logo.png", "rb") as f:
-            image_data = f.read()
+        image_data = await asyncio.to_thread(Path("lighton-logo.png").read_bytes)
         return Response(content=image_data, media_type="image/png")
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="LightOn logo not found")
@@ -197,25 +292,33 @@ async def serve_ybak_logo():
     Serve the YBAK logo image.
     """
     try:
-        with open("ybak-logo.png", "rb") as f:
-            image_data = f.read()
+        image_data = await asyncio.to_thread(Path("ybak-logo.png").read_bytes)
         return Response(content=image_data, media_type="image/png")
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="YBAK logo not found")
 
+# Serialized /health body, rebuilt at most once per second
+_HEALTH_CACHE: Dict[str, Any] = {"body": None, "ts": 0.0}
+
 @app.get("/health", tags=["Health"]) 
 async def health_check():
     """
     Health check endpoint for monitoring.
     
     Provides service status information for deployment platforms.
+    The serialized body is cached for one second since this route is
+    polled frequently by load balancers and warm-up pingers.
     """
-    return {
-        "message": "Workflow Automation API",
-        "version": "1.0.0",
-        "status": "healthy", 
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    now = time.monotonic()
+    if _HEALTH_CACHE["body"] is None or now - _HEALTH_CACHE["ts"] >= 1.0:
+        _HEALTH_CACHE["body"] = orjson.dumps({
+            "message": "Workflow Automation API",
+            "version": "1.0.0",
+            "status": "healthy", 
+            "timestamp": _utc_timestamp()
+        })
+        _HEALTH_CACHE["ts"] = now
+    return Response(content=_HEALTH_CACHE["body"], media_type="application/json")
 
 @api_router.post("/workflows/enhance-description", response_model=WorkflowDescriptionEnhanceResponse, tags=["Workflows"])
 async def enhance_workflow_description(request: WorkflowDescriptionEnhanceRequest):
@@ -247,28 +350,83 @@ async def enhance_workflow_description(request: WorkflowDescriptionEnhanceReques
     validate_anthropic_api_key()
     
     try:
-        logger.info(f"Enhancing workflow description: {request.description[:100]}...")
+        logger.info("Enhancing workflow description: %.100s...", request.description)
         
         # Enhance the description
-        result = await workflow_generator.enhance_workflow_description(request.description)
+        result = await _get_generator().enhance_workflow_description(request.description)
         
         logger.info("Workflow description enhanced successfully")
         
-        return WorkflowDescriptionEnhanceResponse(
+        return WorkflowDescriptionEnhanceResponse.model_construct(
             enhanced_description=result["enhanced_description"],
             questions=result["questions"],
             warnings=result["warnings"]
         )
         
     except Exception as e:
-        logger.error(f"Failed to enhance workflow description: {str(e)}")
+        logger.error("Failed to enhance workflow description: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to enhance workflow description: {str(e)}"
         )
 
-@api_router.post("/workflows", response_model=WorkflowResponse, tags=["Workflows"])
-async def create_workflow(request: WorkflowCreateRequest):
+async def _generate_workflow_in_background(workflow: Workflow) -> None:
+    """
+    Generate code for a stored placeholder workflow after the response is sent.
+    
+    Copies the generated code and final status onto the placeholder so that
+    clients polling GET /workflows/{id} see the result.
+    
+    Args:
+        workflow: Placeholder workflow already stored in the executor
+    """
+    try:
+        generated = await _get_generator().generate_workflow(
+            description=workflow.description,
+            name=workflow.name,
+            context=workflow.context
+        )
+        workflow.generated_code = generated.generated_code
+        workflow.update_status(generated.status)
+        logger.info("Background workflow generation completed: %s", workflow.id)
+    except Exception as e:
+        logger.error("Background workflow generation failed for %s: %s", workflow.id, e)
+        workflow.update_status(WorkflowStatus.FAILED, str(e))
+
+# OpenAPI responses for the creation routes; background=true answers 202 with the placeholder
+_WORKFLOW_CREATE_RESPONSES = {
+    200: {"model": WorkflowResponse},
+    202: {"model": WorkflowResponse, "description": "Accepted; generating in the background (background=true)"},
+}
+
+def _accept_workflow_for_background_generation(
+    description: str,
+    name: Optional[str],
+    context: Optional[Dict[str, Any]],
+    background_tasks: BackgroundTasks
+) -> ORJSONResponse:
+    """
+    Store a placeholder workflow and schedule its generation.
+    
+    Returns immediately with HTTP 202 and status "generating" so the request
+    does not hold a connection open for the whole AI generation.
+    
+    Returns:
+        ORJSONResponse: 202 response with the placeholder WorkflowResponse payload
+    """
+    workflow = Workflow(name=name, description=description, context=context)
+    workflow.update_status(WorkflowStatus.GENERATING)
+    _get_executor().store_workflow(workflow)
+    background_tasks.add_task(_generate_workflow_in_background, workflow)
+    
+    return ORJSONResponse(_workflow_to_dict(workflow), status_code=202)
+
+@api_router.post("/workflows", response_model=None, responses=_WORKFLOW_CREATE_RESPONSES, tags=["Workflows"])
+async def create_workflow(
+    request: WorkflowCreateRequest,
+    background_tasks: BackgroundTasks,
+    background: bool = Query(False, description="Generate the code after responding (HTTP 202); poll GET /workflows/{id}")
+):
     """
     Create a new workflow from a natural language description.
     
@@ -278,6 +436,9 @@ async def create_workflow(request: WorkflowCreateRequest):
     
     Args:
         request: Workflow creation request containing description, optional name, and context
+        background: If true, return 202 immediately and generate the code in a
+            background task; clients poll GET /workflows/{id} until the status
+            is "ready" or "failed". Requires a long-running server process.
         
     Returns:
         WorkflowResponse: Complete workflow details including generated code
@@ -295,40 +456,67 @@ async def create_workflow(request: WorkflowCreateRequest):
     # Validate required API keys
     validate_anthropic_api_key()
     
+    if background:
+        return _accept_workflow_for_background_generation(
+            request.description, request.name, request.context, background_tasks
+        )
+    
     try:
-        logger.info(f"Creating workflow: {request.description[:100]}...")
+        logger.info("Creating workflow: %.100s...", request.description)
         
         # Generate the workflow
-        workflow = await workflow_generator.generate_workflow(
+        workflow = await _get_generator().generate_workflow(
             description=request.description,
             name=request.name,
             context=request.context
         )
         
         # Store the workflow in the executor
-        workflow_executor.store_workflow(workflow)
+        _get_executor().store_workflow(workflow)
         
-        logger.info(f"Workflow created successfully: {workflow.id}")
+        logger.info("Workflow created successfully: %s", workflow.id)
         
-        return WorkflowResponse(
-            id=workflow.id,
-            name=workflow.name,
-            description=workflow.description,
-            status=workflow.status,
-            generated_code=workflow.generated_code,
-            created_at=workflow.created_at,
-            updated_at=workflow.updated_at,
-            error=workflow.error
-        )
+        return ORJSONResponse(_workflow_to_dict(workflow))
         
     except Exception as e:
-        logger.error(f"Failed to create workflow: {str(e)}")
+        logger.error("Failed to create workflow: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to create workflow: {str(e)}"
         )
 
-@api_router.get("/workflows/{workflow_id}", response_model=WorkflowResponse, tags=["Workflows"])
+def _workflow_to_dict(workflow: Workflow) -> Dict[str, Any]:
+    """
+    Build the WorkflowResponse payload for a stored workflow.
+    
+    Workflows are created by the server itself, so endpoints return this
+    dict directly as an ORJSONResponse instead of re-validating a Pydantic
+    model; WorkflowResponse remains the documented response schema.
+    """
+    return {
+        "id": workflow.id,
+        "name": workflow.name,
+        "description": workflow.description,
+        "status": workflow.status,
+        "generated_code": workflow.generated_code,
+        "created_at": workflow.created_at,
+        "updated_at": workflow.updated_at,
+        "error": workflow.error
+    }
+
+def _execution_to_dict(execution: WorkflowExecution) -> Dict[str, Any]:
+    """Build the WorkflowExecutionResponse payload for a stored execution."""
+    return {
+        "workflow_id": execution.workflow_id,
+        "execution_id": execution.id,
+        "result": execution.result,
+        "status": execution.status.value,
+        "execution_time": execution.execution_time,
+        "error": execution.error,
+        "created_at": execution.created_at
+    }
+
+@api_router.get("/workflows/{workflow_id}", response_model=None, responses={200: {"model": WorkflowResponse}}, tags=["Workflows"])
 async def get_workflow(workflow_id: str):
     """
     Retrieve details of a specific workflow by ID.
@@ -344,37 +532,51 @@ async def get_workflow(workflow_id: str):
         WorkflowResponse: Complete workflow details
         
     Raises:
-        HTTPException: 404 if workflow not found, 500 for other errors
+        HTTPException: 404 if workflow not found (other errors reach the global handler)
     """
-    try:
-        workflow = workflow_executor.get_workflow(workflow_id)
-        if not workflow:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Workflow {workflow_id} not found"
-            )
-        
-        return WorkflowResponse(
-            id=workflow.id,
-            name=workflow.name,
-            description=workflow.description,
-            status=workflow.status,
-            generated_code=workflow.generated_code,
-            created_at=workflow.created_at,
-            updated_at=workflow.updated_at,
-            error=workflow.error
+    workflow = _get_executor().get_workflow(workflow_id)
+    if not workflow:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Workflow {workflow_id} not found"
         )
+    
+    return ORJSONResponse(_workflow_to_dict(workflow))
+
+async def _fetch_attached_file_infos(file_ids: List[int]) -> List[Dict[str, Any]]:
+    """
+    Validate attached files with one concurrent round of metadata lookups.
+    
+    Unknown files are reported before the workflow starts instead of
+    failing somewhere inside the generated code.
+    
+    Args:
+        file_ids: IDs of the files attached to the execution
         
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get workflow {workflow_id}: {str(e)}")
+    Returns:
+        List of Paradigm file metadata dicts, in the same order as file_ids
+        
+    Raises:
+        HTTPException: 503 if the LightOn API key is missing,
+            400 if any file cannot be retrieved
+    """
+    validate_lighton_api_key()
+    
+    paradigm_client = _get_paradigm_client()
+    infos = await asyncio.gather(
+        *[paradigm_client.get_file_info(file_id, include_content=False) for file_id in file_ids],
+        return_exceptions=True
+    )
+    
+    invalid = [f"{file_id} ({info})" for file_id, info in zip(file_ids, infos) if isinstance(info, Exception)]
+    if invalid:
         raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get workflow: {str(e)}"
+            status_code=400,
+            detail=f"Invalid attached files: {', '.join(invalid)}"
         )
+    return infos
 
-@api_router.post("/workflows/{workflow_id}/execute", response_model=WorkflowExecutionResponse, tags=["Execution"])
+@api_router.post("/workflows/{workflow_id}/execute", response_model=None, responses={200: {"model": WorkflowExecutionResponse}}, tags=["Execution"])
 async def execute_workflow(workflow_id: str, request: WorkflowExecuteRequest):
     """
     Execute a workflow with user input and optional file attachments.
@@ -391,43 +593,46 @@ async def execute_workflow(workflow_id: str, request: WorkflowExecuteRequest):
         WorkflowExecutionResponse: Execution results with status and timing
         
     Raises:
-        HTTPException: 400 for validation errors, 500 for execution failures
+        HTTPException: 400 for validation errors or unknown attached files,
+            503 if files are attached but the LightOn API key is missing,
+            500 for execution failures
         
     Note:
         Execution timeout is configured via settings.max_execution_time (default: 5 minutes)
     """
+    attached_file_infos = None
+    if request.attached_file_ids:
+        attached_file_infos = await _fetch_attached_file_infos(request.attached_file_ids)
+    
     try:
-        logger.info(f"Executing workflow {workflow_id} with input: {request.user_input[:100]}...")
+        logger.info("Executing workflow %s with input: %.100s...", workflow_id, request.user_input)
         
         # Execute the workflow
-        execution = await workflow_executor.execute_workflow(workflow_id, request.user_input, request.attached_file_ids)
-        
-        logger.info(f"Workflow execution completed: {execution.id} (status: {execution.status})")
-        
-        return WorkflowExecutionResponse(
-            workflow_id=execution.workflow_id,
-            execution_id=execution.id,
-            result=execution.result,
-            status=execution.status.value,
-            execution_time=execution.execution_time,
-            error=execution.error,
-            created_at=execution.created_at
+        execution = await _get_executor().execute_workflow(
+            workflow_id,
+            request.user_input,
+            request.attached_file_ids,
+            attached_file_infos=attached_file_infos
         )
         
+        logger.info("Workflow execution completed: %s (status: %s)", execution.id, execution.status)
+        
+        return ORJSONResponse(_execution_to_dict(execution))
+        
     except ValueError as e:
-        logger.error(f"Validation error: {str(e)}")
+        logger.error("Validation error: %s", e)
         raise HTTPException(
             status_code=400,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Failed to execute workflow {workflow_id}: {str(e)}")
+        logger.error("Failed to execute workflow %s: %s", workflow_id, e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to execute workflow: {str(e)}"
         )
 
-@api_router.post("/workflows/{workflow_id}/apply-feedback", response_model=WorkflowResponse, tags=["Workflows"])
+@api_router.post("/workflows/{workflow_id}/apply-feedback", response_model=None, responses={200: {"model": WorkflowResponse}}, tags=["Workflows"])
 async def apply_feedback_to_workflow(workflow_id: str, feedback: str = Body(..., embed=True)):
     """
     Apply user feedback to modify an existing workflow's generated code.
@@ -450,14 +655,14 @@ async def apply_feedback_to_workflow(workflow_id: str, feedback: str = Body(...,
     
     try:
         # Get the original workflow
-        original_workflow = workflow_executor.get_workflow(workflow_id)
+        original_workflow = _get_executor().get_workflow(workflow_id)
         if not original_workflow:
             raise HTTPException(
                 status_code=404,
                 detail=f"Workflow {workflow_id} not found"
             )
         
-        logger.info(f"Applying feedback to workflow {workflow_id}: {feedback[:100]}...")
+        logger.info("Applying feedback to workflow %s: %.100s...", workflow_id, feedback)
         
         # Create enhanced description with feedback for regeneration
         enhanced_description = f"""
@@ -481,7 +686,7 @@ INSTRUCTIONS: Modify the workflow code based on the user feedback while:
 Generate the improved workflow code that incorporates the user feedback."""
         
         # Generate improved workflow
-        improved_workflow = await workflow_generator.generate_workflow(
+        improved_workflow = await _get_generator().generate_workflow(
             description=enhanced_description,
             name=f"Improved: {original_workflow.name or 'Workflow'}",
             context={
@@ -493,25 +698,16 @@ Generate the improved workflow code that incorporates the user feedback."""
         )
         
         # Store the improved workflow
-        workflow_executor.store_workflow(improved_workflow)
-        
-        logger.info(f"Workflow improved successfully: {improved_workflow.id}")
-        
-        return WorkflowResponse(
-            id=improved_workflow.id,
-            name=improved_workflow.name,
-            description=improved_workflow.description,
-            status=improved_workflow.status,
-            generated_code=improved_workflow.generated_code,
-            created_at=improved_workflow.created_at,
-            updated_at=improved_workflow.updated_at,
-            error=improved_workflow.error
-        )
+        _get_executor().store_workflow(improved_workflow)
+        
+        logger.info("Workflow improved successfully: %s", improved_workflow.id)
+        
+        return ORJSONResponse(_workflow_to_dict(improved_workflow))
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to apply feedback to workflow {workflow_id}: {str(e)}")
+        logger.error("Failed to apply feedback to workflow %s: %s", workflow_id, e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to apply feedback: {str(e)}"
@@ -586,25 +782,25 @@ ACTUAL OUTPUT:
 
 Evaluate if this test passes the validation criteria."""
 
-        response = workflow_generator.anthropic_client.messages.create(
+        generator = _get_generator()
+        response = await generator.run_anthropic_request(lambda: generator.anthropic_client.messages.create(
             model="claude-sonnet-4-20250514",
             max_tokens=1000,
             temperature=0,
             system=system_prompt,
             messages=[{"role": "user", "content": evaluation_content}]
-        )
+        ))
         
         result_text = response.content[0].text.strip()
         
         # Parse JSON response
-        import json
         try:
-            result = json.loads(result_text)
+            result = orjson.loads(result_text)
             return {
                 "passed": result.get("passed", False),
                 "feedback": result.get("feedback", "Evaluation completed")
             }
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # Fallback if JSON parsing fails
             return {
                 "passed": False,
@@ -612,7 +808,7 @@ Evaluate if this test passes the validation criteria."""
             }
             
     except Exception as e:
-        logger.error(f"AI evaluation failed: {str(e)}")
+        logger.error("AI evaluation failed: %s", e)
         return {
             "passed": False,
             "feedback": f"Evaluation error: {str(e)}"
@@ -635,6 +831,7 @@ async def run_automated_workflow_testing(request: AutomatedTestRequest):
         
     Raises:
         HTTPException: 503 if API keys are missing, 400 for validation errors
+            or unknown attached files
     """
     # Validate required API keys
     validate_anthropic_api_key()
@@ -642,8 +839,14 @@ async def run_automated_workflow_testing(request: AutomatedTestRequest):
     if not request.test_examples:
         raise HTTPException(status_code=400, detail="At least one test example is required")
     
+    # Attached file metadata is fetched once and reused across iterations
+    attached_file_infos = [
+        await _fetch_attached_file_infos(test_example.attached_file_ids) if test_example.attached_file_ids else None
+        for test_example in request.test_examples
+    ]
+    
     try:
-        logger.info(f"Starting automated testing with {len(request.test_examples)} test examples")
+        logger.info("Starting automated testing with %s test examples", len(request.test_examples))
         
         current_code = request.workflow_code
         iteration_history = []
@@ -658,28 +861,29 @@ async def run_automated_workflow_testing(request: AutomatedTestRequest):
         else:
             max_iterations = request.max_iterations or 10
             
-        logger.info(f"Testing mode: {request.iteration_mode}, max iterations: {max_iterations}")
+        logger.info("Testing mode: %s, max iterations: %s", request.iteration_mode, max_iterations)
         
         while total_iterations < max_iterations and not all_tests_passed:
             total_iterations += 1
             iteration_start_time = datetime.utcnow()
             
-            logger.info(f"Starting iteration {total_iterations}/{max_iterations}")
+            logger.info("Starting iteration %s/%s", total_iterations, max_iterations)
             
             # Run all test examples
             test_results = []
             failed_tests = []
             
-            for test_example in request.test_examples:
+            for test_example, file_infos in zip(request.test_examples, attached_file_infos):
                 try:
-                    logger.info(f"Running test: {test_example.id}")
+                    logger.info("Running test: %s", test_example.id)
                     
                     # Execute workflow with test input
                     execution_start_time = datetime.utcnow()
-                    execution = await workflow_executor.execute_code_directly(
+                    execution = await _get_executor().execute_code_directly(
                         code=current_code,
                         user_input=test_example.query,
-                        attached_file_ids=test_example.attached_file_ids or []
+                        attached_file_ids=test_example.attached_file_ids or [],
+                        attached_file_infos=file_infos
                     )
                     execution_time = (datetime.utcnow() - execution_start_time).total_seconds()
                     
@@ -708,10 +912,10 @@ async def run_automated_workflow_testing(request: AutomatedTestRequest):
                             "error": execution.error
                         })
                         
-                    logger.info(f"Test {test_example.id}: {'PASSED' if evaluation['passed'] else 'FAILED'}")
+                    logger.info("Test %s: %s", test_example.id, 'PASSED' if evaluation['passed'] else 'FAILED')
                     
                 except Exception as e:
-                    logger.error(f"Test execution failed for {test_example.id}: {str(e)}")
+                    logger.error("Test execution failed for %s: %s", test_example.id, e)
                     test_result = TestResult(
                         test_id=test_example.id,
                         passed=False,
@@ -742,12 +946,12 @@ async def run_automated_workflow_testing(request: AutomatedTestRequest):
             
             if all_tests_passed:
                 stopped_reason = "all_passed"
-                logger.info(f"All tests passed after {total_iterations} iterations!")
+                logger.info("All tests passed after %s iterations!", total_iterations)
                 break
                 
             # If not all tests passed and we have more iterations, improve the code
             if total_iterations < max_iterations:
-                logger.info(f"Improving code based on {len(failed_tests)} failed tests")
+                logger.info("Improving code based on %s failed tests", len(failed_tests))
                 
                 # Generate improvement feedback
                 improvement_feedback = "Based on test failures, please improve the workflow code:\n\n"
@@ -778,7 +982,7 @@ INSTRUCTIONS: Modify the workflow code to address all test failures while:
 Generate the improved workflow code."""
 
                 try:
-                    improved_workflow = await workflow_generator.generate_workflow(
+                    improved_workflow = await _get_generator().generate_workflow(
                         description=enhanced_description,
                         name=f"Auto-improved Iteration {total_iterations}",
                         context={
@@ -789,10 +993,10 @@ Generate the improved workflow code."""
                     )
                     
                     current_code = improved_workflow.generated_code
-                    logger.info(f"Code improved for iteration {total_iterations + 1}")
+                    logger.info("Code improved for iteration %s", total_iterations + 1)
                     
                 except Exception as e:
-                    logger.error(f"Code improvement failed: {str(e)}")
+                    logger.error("Code improvement failed: %s", e)
                     stopped_reason = "improvement_failed"
                     break
         
@@ -826,17 +1030,17 @@ Generate the improved workflow code."""
             problematic_tests=problematic_tests if problematic_tests else None
         )
         
-        logger.info(f"Automated testing completed: {stopped_reason}, {total_iterations} iterations")
+        logger.info("Automated testing completed: %s, %s iterations", stopped_reason, total_iterations)
         return final_response
         
     except Exception as e:
-        logger.error(f"Automated testing failed: {str(e)}")
+        logger.error("Automated testing failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Automated testing failed: {str(e)}"
         )
 
-@api_router.post("/workflows/execute-code", response_model=WorkflowExecutionResponse, tags=["Execution"])
+@api_router.post("/workflows/execute-code", response_model=None, responses={200: {"model": WorkflowExecutionResponse}}, tags=["Execution"])
 async def execute_workflow_code(request: WorkflowCodeExecuteRequest):
     """
     Execute workflow code either from UI or from project's workflow_code.py file.
@@ -852,17 +1056,19 @@ async def execute_workflow_code(request: WorkflowCodeExecuteRequest):
         WorkflowExecutionResponse: Execution results including status, timing, and output
         
     Raises:
-        HTTPException: If no code source is available or execution fails
+        HTTPException: If no code source is available, an attached file is
+            unknown (400), or execution fails
         
     Note:
         The code will have access to global 'attached_file_ids' variable
-        containing the list of file IDs from request.attached_file_ids
+        containing the list of file IDs from request.attached_file_ids, and
+        to 'attached_file_infos' with their pre-fetched metadata
     """
     try:
-        logger.info(f"Executing workflow code")
-        logger.info(f"User input: {request.user_input[:100]}...")
+        logger.info("Executing workflow code")
+        logger.info("User input: %.100s...", request.user_input)
         if request.attached_file_ids:
-            logger.info(f"Attached files: {request.attached_file_ids}")
+            logger.info("Attached files: %s", request.attached_file_ids)
         
         # Determine code source: UI code or file-based code
         if request.code and request.code.strip():
@@ -870,15 +1076,14 @@ async def execute_workflow_code(request: WorkflowCodeExecuteRequest):
             workflow_code = request.code
             code_source = "UI"
             workflow_id = "ui-code-execution"
-            logger.info(f"Using code from UI: {len(workflow_code)} characters")
+            logger.info("Using code from UI: %s characters", len(workflow_code))
         else:
             # Read workflow code from the project file
             try:
-                with open("workflow_code.py", "r", encoding="utf-8") as f:
-                    workflow_code = f.read()
+                workflow_code = await asyncio.to_thread(Path("workflow_code.py").read_text, encoding="utf-8")
                 code_source = "File"
                 workflow_id = "file-based-execution"
-                logger.info(f"Using code from workflow_code.py: {len(workflow_code)} characters")
+                logger.info("Using code from workflow_code.py: %s characters", len(workflow_code))
             except FileNotFoundError:
                 raise HTTPException(
                     status_code=400, 
@@ -890,28 +1095,32 @@ async def execute_workflow_code(request: WorkflowCodeExecuteRequest):
                     detail=f"Failed to read workflow_code.py: {str(e)}"
                 )
         
+        # Fetch attached file metadata so the code can read attached_file_infos
+        attached_file_infos = None
+        if request.attached_file_ids:
+            attached_file_infos = await _fetch_attached_file_infos(request.attached_file_ids)
+        
         # Execute the workflow code using workflow executor's safe execution method
-        execution = await workflow_executor.execute_code_directly(workflow_code, request.user_input, request.attached_file_ids)
-        
-        logger.info(f"Code execution completed from {code_source}: {execution.id} (status: {execution.status})")
-        
-        return WorkflowExecutionResponse(
-            workflow_id=workflow_id,
-            execution_id=execution.id,
-            result=execution.result,
-            status=execution.status.value,
-            execution_time=execution.execution_time,
-            error=execution.error,
-            created_at=execution.created_at
+        execution = await _get_executor().execute_code_directly(
+            workflow_code,
+            request.user_input,
+            request.attached_file_ids,
+            attached_file_infos=attached_file_infos
         )
         
+        logger.info("Code execution completed from %s: %s (status: %s)", code_source, execution.id, execution.status)
+        
+        payload = _execution_to_dict(execution)
+        payload["workflow_id"] = workflow_id
+        return ORJSONResponse(payload)
+        
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Code execution error: {str(e)}")
+        logger.error("Code execution error: %s", e)
         raise HTTPException(status_code=500, detail=f"Code execution failed: {str(e)}")
 
-@api_router.get("/workflows/{workflow_id}/executions/{execution_id}", response_model=WorkflowExecutionResponse, tags=["Execution"])
+@api_router.get("/workflows/{workflow_id}/executions/{execution_id}", response_model=None, responses={200: {"model": WorkflowExecutionResponse}}, tags=["Execution"])
 async def get_execution(workflow_id: str, execution_id: str):
     """
     Retrieve details of a specific workflow execution.
@@ -930,38 +1139,20 @@ async def get_execution(workflow_id: str, execution_id: str):
     Raises:
         HTTPException: 404 if execution not found, 400 if execution doesn't belong to workflow
     """
-    try:
-        execution = workflow_executor.get_execution(execution_id)
-        if not execution:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Execution {execution_id} not found"
-            )
-        
-        if execution.workflow_id != workflow_id:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Execution {execution_id} does not belong to workflow {workflow_id}"
-            )
-        
-        return WorkflowExecutionResponse(
-            workflow_id=execution.workflow_id,
-            execution_id=execution.id,
-            result=execution.result,
-            status=execution.status.value,
-            execution_time=execution.execution_time,
-            error=execution.error,
-            created_at=execution.created_at
+    execution = _get_executor().get_execution(execution_id)
+    if not execution:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Execution {execution_id} not found"
         )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get execution {execution_id}: {str(e)}")
+    
+    if execution.workflow_id != workflow_id:
         raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get execution: {str(e)}"
+            status_code=400,
+            detail=f"Execution {execution_id} does not belong to workflow {workflow_id}"
         )
+    
+    return ORJSONResponse(_execution_to_dict(execution))
 
 # File upload and management endpoints
 
@@ -996,25 +1187,26 @@ async def upload_file(
     validate_lighton_api_key()
     
     try:
-        logger.info(f"Uploading file: {file.filename}")
+        logger.info("Uploading file: %s", file.filename)
         
-        # Read file content
-        file_content = await file.read()
+        # Stream the spooled upload straight through instead of reading it into memory
+        await file.seek(0)
         
         # Upload to Paradigm
-        result = await paradigm_client.upload_file(
-            file_content=file_content,
+        result = await _get_paradigm_client().upload_file(
+            fileobj=file.file,
             filename=file.filename,
             collection_type=collection_type,
-            workspace_id=workspace_id
+            workspace_id=workspace_id,
+            content_type=file.content_type or "application/octet-stream"
         )
         
-        logger.info(f"File uploaded successfully: {result.get('id')}")
+        logger.info("File uploaded successfully: %s", result.get('id'))
         
-        return FileUploadResponse(**result)
+        return FileUploadResponse.model_validate(result)
         
     except Exception as e:
-        logger.error(f"Failed to upload file: {str(e)}")
+        logger.error("Failed to upload file: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to upload file: {str(e)}"
@@ -1042,17 +1234,17 @@ async def get_file_info(file_id: int, include_content: bool = False):
     validate_lighton_api_key()
     
     try:
-        result = await paradigm_client.get_file_info(file_id, include_content)
-        return FileInfoResponse(**result)
+        result = await _get_paradigm_client().get_file_info(file_id, include_content)
+        return FileInfoResponse.model_validate(result)
         
     except Exception as e:
-        logger.error(f"Failed to get file info for {file_id}: {str(e)}")
+        logger.error("Failed to get file info for %s: %s", file_id, e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to get file info: {str(e)}"
         )
 
-@api_router.post("/files/{file_id}/ask", response_model=FileQuestionResponse, tags=["Files"])
+@api_router.post("/files/{file_id}/ask", response_model=None, responses={200: {"model": FileQuestionResponse}}, tags=["Files"])
 async def ask_question_about_file(file_id: int, request: FileQuestionRequest):
     """
     Ask a natural language question about a specific uploaded file.
@@ -1074,11 +1266,11 @@ async def ask_question_about_file(file_id: int, request: FileQuestionRequest):
     validate_lighton_api_key()
     
     try:
-        result = await paradigm_client.ask_question_about_file(file_id, request.question)
-        return FileQuestionResponse(**result)
+        result = await _get_paradigm_client().ask_question_about_file(file_id, request.question)
+        return ORJSONResponse({"response": result["response"], "chunks": result.get("chunks", [])})
         
     except Exception as e:
-        logger.error(f"Failed to ask question about file {file_id}: {str(e)}")
+        logger.error("Failed to ask question about file %s: %s", file_id, e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to ask question: {str(e)}"
@@ -1108,18 +1300,22 @@ async def delete_file(file_id: int):
     validate_lighton_api_key()
     
     try:
-        success = await paradigm_client.delete_file(file_id)
+        success = await _get_paradigm_client().delete_file(file_id)
         return {"success": success, "message": f"File {file_id} deleted successfully"}
         
     except Exception as e:
-        logger.error(f"Failed to delete file {file_id}: {str(e)}")
+        logger.error("Failed to delete file %s: %s", file_id, e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to delete file: {str(e)}"
         )
 
-@api_router.post("/workflows-with-files", response_model=WorkflowResponse, tags=["Workflows"])
-async def create_workflow_with_files(request: WorkflowWithFilesRequest):
+@api_router.post("/workflows-with-files", response_model=None, responses=_WORKFLOW_CREATE_RESPONSES, tags=["Workflows"])
+async def create_workflow_with_files(
+    request: WorkflowWithFilesRequest,
+    background_tasks: BackgroundTasks,
+    background: bool = Query(False, description="Generate the code after responding (HTTP 202); poll GET /workflows/{id}")
+):
     """
     Create a workflow that has access to specific uploaded files.
     
@@ -1129,6 +1325,8 @@ async def create_workflow_with_files(request: WorkflowWithFilesRequest):
     
     Args:
         request: Workflow creation request with file IDs to attach
+        background: If true, return 202 immediately and generate the code in a
+            background task (see create_workflow)
         
     Returns:
         WorkflowResponse: Complete workflow details with file access capabilities
@@ -1143,7 +1341,7 @@ async def create_workflow_with_files(request: WorkflowWithFilesRequest):
     validate_anthropic_api_key()
     
     try:
-        logger.info(f"Creating workflow with files: {request.uploaded_file_ids}")
+        logger.info("Creating workflow with files: %s", request.uploaded_file_ids)
         
         # Add file IDs to context
         context = request.context or {}
@@ -1151,31 +1349,27 @@ async def create_workflow_with_files(request: WorkflowWithFilesRequest):
             context["uploaded_file_ids"] = request.uploaded_file_ids
             context["use_uploaded_files"] = True
         
+        if background:
+            return _accept_workflow_for_background_generation(
+                request.description, request.name, context, background_tasks
+            )
+        
         # Generate the workflow
-        workflow = await workflow_generator.generate_workflow(
+        workflow = await _get_generator().generate_workflow(
             description=request.description,
             name=request.name,
             context=context
         )
         
         # Store the workflow in the executor
-        workflow_executor.store_workflow(workflow)
+        _get_executor().store_workflow(workflow)
         
-        logger.info(f"Workflow with files created successfully: {workflow.id}")
+        logger.info("Workflow with files created successfully: %s", workflow.id)
         
-        return WorkflowResponse(
-            id=workflow.id,
-            name=workflow.name,
-            description=workflow.description,
-            status=workflow.status,
-            generated_code=workflow.generated_code,
-            created_at=workflow.created_at,
-            updated_at=workflow.updated_at,
-            error=workflow.error
-        )
+        return ORJSONResponse(_workflow_to_dict(workflow))
         
     except Exception as e:
-        logger.error(f"Failed to create workflow with files: {str(e)}")
+        logger.error("Failed to create workflow with files: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to create workflow with files: {str(e)}"
@@ -1185,6 +1379,9 @@ async def create_workflow_with_files(request: WorkflowWithFilesRequest):
 # Include the API router in the main app
 app.include_router(api_router, prefix="/api")
 
+# Pre-serialized ErrorResponse body; only the details and timestamp are filled per error
+_ERROR_TEMPLATE = b'{"error":"Internal server error","details":%s,"timestamp":"%s"}'
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """
@@ -1199,25 +1396,35 @@ async def global_exception_handler(request, exc):
         exc: The unhandled exception
         
     Returns:
-        ErrorResponse: Standardized error response with timestamp
+        Response: 500 JSON response shaped like ErrorResponse, with timestamp
         
     Note:
         All exceptions are logged for monitoring and debugging purposes
     """
-    logger.error(f"Unhandled exception: {str(exc)}")
-    return ErrorResponse(
-        error="Internal server error",
-        details=str(exc) if settings.debug else None,
-        timestamp=datetime.utcnow()
+    logger.error("Unhandled exception: %s", exc)
+    body = _ERROR_TEMPLATE % (
+        orjson.dumps(str(exc)) if settings.debug else b"null",
+        _utc_timestamp().encode()
     )
+    return Response(content=body, status_code=500, media_type="application/json")
 
 # Development server entry point
 if __name__ == "__main__":
     import uvicorn
-    # Run the development server with auto-reload in debug mode
+    # Run the development server with auto-reload in debug mode.
+    # "auto" picks uvloop and httptools (from uvicorn[standard]) when they are
+    # importable, for higher request throughput, and falls back to asyncio and
+    # h11 otherwise (uvloop is not available on Windows).
+    # Extra worker processes (WORKERS) only apply outside debug mode, since
+    # uvicorn cannot combine them with auto-reload. Each worker keeps its own
+    # workflow store and caches, so multi-worker deployments need sticky routing.
     uvicorn.run(
         "api.main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.debug
+        reload=settings.debug,
+        workers=1 if settings.debug else settings.workers,
+        loop="auto",
+        http="auto",
+        log_level="info" if settings.debug else "warning"
     )
\ No newline at end of file
@@ -17,31 +17,23 @@ Features:
     - Type hints and field descriptions
     - Enum-based status management
     - DateTime handling with proper formatting
+
+Validation Boundary:
+    Request models are validated in full, since they carry client input.
+    File responses are filled from raw Paradigm API JSON, which is just as
+    untrusted, so they are validated with model_validate(). Only responses
+    built from data the server produced itself (stored workflows, generator
+    output) skip validation: the enhancement response uses model_construct(),
+    and the workflow, execution and error paths return plain dicts through
+    ORJSONResponse, with their models only documenting the OpenAPI schema.
+    The file-question path also returns a plain dict, holding just the
+    answer and chunks taken from the Paradigm result.
 """
 
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field
-from enum import Enum
-
-class WorkflowStatus(str, Enum):
-    """
-    Enumeration of possible workflow status values.
-    
-    States:
-        CREATED: Workflow has been created but code generation hasn't started
-        GENERATING: AI is currently generating code for the workflow
-        READY: Code generation complete, workflow ready for execution
-        EXECUTING: Workflow is currently being executed
-        COMPLETED: Workflow execution completed successfully
-        FAILED: Workflow creation or execution failed
-    """
-    CREATED = "created"
-    GENERATING = "generating"
-    READY = "ready"
-    EXECUTING = "executing"
-    COMPLETED = "completed"
-    FAILED = "failed"
+from .workflow.models import WorkflowStatus
 
 class WorkflowCreateRequest(BaseModel):
     """
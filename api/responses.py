@@ -0,0 +1,33 @@
+"""
+Custom Response Classes
+
+This module defines the response classes used by the FastAPI application.
+
+Classes:
+    - ORJSONResponse: JSON response rendered with orjson
+
+Features:
+    - Native serialization of datetime, Enum and UUID values
+    - str() fallback for any other value, so handlers can return plain dicts
+    - Direct bytes output without an intermediate str encode
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson.
+    
+    Equivalent to fastapi.responses.ORJSONResponse, which recent FastAPI
+    releases deprecate, kept locally so the app does not depend on it.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+        )
@@ -18,6 +18,10 @@ Features:
 import re
 from typing import List
 
+# Patterns compiled once at import rather than looked up per call
+_SENTENCE_BOUNDARY_RE = re.compile(r'[.!?]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 def split_into_sentences(text: str) -> List[str]:
     """
     Split text into sentences using basic regex.
@@ -35,12 +39,8 @@ def split_into_sentences(text: str) -> List[str]:
         Basic implementation - could be enhanced with NLP libraries for better accuracy
     """
     # Basic sentence splitting - can be enhanced with more sophisticated NLP
-    sentences = re.split(r'[.!?]+', text)
-    
-    # Clean up sentences
-    sentences = [s.strip() for s in sentences if s.strip()]
-    
-    return sentences
+    # Strip each piece once and drop the empty ones in a single pass
+    return list(filter(None, map(str.strip, _SENTENCE_BOUNDARY_RE.split(text))))
 
 def clean_text(text: str) -> str:
     """
@@ -56,7 +56,7 @@ def clean_text(text: str) -> str:
         Cleaned and normalized text
     """
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -81,11 +81,5 @@ def format_qa_pairs(pairs: List[tuple]) -> str:
         >>> format_qa_pairs(pairs)
         'Question: What is AI?\nAnswer: Artificial Intelligence'
     """
-    formatted_lines = []
-    
-    for question, answer in pairs:
-        formatted_lines.append(f"Question: {question}")
-        formatted_lines.append(f"Answer: {answer}")
-        formatted_lines.append("")  # Empty line separator
-    
-    return "\n".join(formatted_lines).strip()
\ No newline at end of file
+    # One formatted block per pair, separated by an empty line
+    return "\n\n".join(f"Question: {question}\nAnswer: {answer}" for question, answer in pairs)
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""
+Generated Code Cache
+
+This module provides an in-process cache for AI-generated workflow code,
+so identical workflow requests are served without another Anthropic call.
+
+Classes:
+    - GeneratedCodeCache: Bounded LRU cache of validated generated code
+
+Functions:
+    - canonical_json: Deterministic JSON encoding used to build cache keys
+
+Key Features:
+    - Exact-match lookup on a SHA-256 digest of the generation inputs
+    - Namespacing by system prompt version so prompt changes invalidate entries
+    - Least-recently-used eviction with a fixed maximum size
+
+Note:
+    The cache lives in process memory, so each server worker keeps its own
+    entries and they are lost on restart.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Optional, Dict, Any
+
+import orjson
+
+def canonical_json(value: Any) -> bytes:
+    """
+    Encode value as JSON with sorted keys, so equal contexts hash equally.
+    
+    Non-JSON values (datetimes, custom objects) fall back to str().
+    """
+    return orjson.dumps(value, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+
+class GeneratedCodeCache:
+    """
+    Bounded LRU cache mapping generation inputs to validated generated code.
+    
+    Only code that passed validation should be stored, so cache hits can be
+    returned directly without re-validating.
+    
+    Attributes:
+        max_entries: Maximum number of cached entries before eviction
+    """
+    
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+    
+    @staticmethod
+    def make_key(namespace: str, description: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the cache key for a generation request.
+        
+        Args:
+            namespace: Identifier of the prompt version used for generation
+            description: Workflow description sent to the model
+            context: Additional context, canonicalized with sorted keys
+            
+        Returns:
+            Hex SHA-256 digest of the namespaced inputs
+        """
+        digest = hashlib.sha256()
+        digest.update(namespace.encode("utf-8"))
+        digest.update(b"\x1f")
+        digest.update(description.encode("utf-8"))
+        digest.update(b"\x1f")
+        digest.update(canonical_json(context))
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached code for key, marking it as recently used."""
+        code = self._entries.get(key)
+        if code is not None:
+            self._entries.move_to_end(key)
+        return code
+    
+    def set(self, key: str, code: str) -> None:
+        """Store validated code for key, evicting the least recently used entry if full."""
+        self._entries[key] = code
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -4,8 +4,10 @@ import sys
 import io
 import logging
 from contextlib import redirect_stdout, redirect_stderr
+from functools import lru_cache
+from types import CodeType
 from typing import Optional, Dict, Any, List
-from .models import Workflow, WorkflowExecution, ExecutionStatus
+from .models import Workflow, WorkflowExecution, WorkflowStatus, ExecutionStatus
 from ..config import settings
 
 logger = logging.getLogger(__name__)
@@ -28,7 +30,13 @@ class WorkflowExecutor:
         """Retrieve an execution record"""
         return self.executions.get(execution_id)
     
-    async def execute_workflow(self, workflow_id: str, user_input: str, attached_file_ids: Optional[List[int]] = None) -> WorkflowExecution:
+    async def execute_workflow(
+        self,
+        workflow_id: str,
+        user_input: str,
+        attached_file_ids: Optional[List[int]] = None,
+        attached_file_infos: Optional[List[Dict[str, Any]]] = None
+    ) -> WorkflowExecution:
         """
         Execute a workflow with given user input
         
@@ -36,6 +44,7 @@ class WorkflowExecutor:
             workflow_id: ID of the workflow to execute
             user_input: Input data for the workflow
             attached_file_ids: Optional list of file IDs attached to this execution
+            attached_file_infos: Optional pre-fetched metadata for the attached files
         
         Returns:
             WorkflowExecution object with results
@@ -44,8 +53,8 @@ class WorkflowExecutor:
         if not workflow:
             raise ValueError(f"Workflow {workflow_id} not found")
         
-        if workflow.status != "ready":
-            raise ValueError(f"Workflow {workflow_id} is not ready for execution (status: {workflow.status})")
+        if workflow.status is not WorkflowStatus.READY:
+            raise ValueError(f"Workflow {workflow_id} is not ready for execution (status: {workflow.status.value})")
         
         execution = WorkflowExecution(
             workflow_id=workflow_id,
@@ -59,7 +68,7 @@ class WorkflowExecutor:
         
         try:
             # Execute the workflow code
-            result = await self._execute_code_safely(workflow.generated_code, user_input, attached_file_ids)
+            result = await self._execute_code_safely(workflow.generated_code, user_input, attached_file_ids, attached_file_infos)
             execution_time = time.time() - start_time
             
             execution.mark_completed(result, execution_time)
@@ -75,7 +84,13 @@ class WorkflowExecutor:
         
         return execution
     
-    async def execute_code_directly(self, code: str, user_input: str, attached_file_ids: Optional[List[int]] = None) -> WorkflowExecution:
+    async def execute_code_directly(
+        self,
+        code: str,
+        user_input: str,
+        attached_file_ids: Optional[List[int]] = None,
+        attached_file_infos: Optional[List[Dict[str, Any]]] = None
+    ) -> WorkflowExecution:
         """
         Execute workflow code directly without requiring a stored workflow.
         
@@ -83,6 +98,7 @@ class WorkflowExecutor:
             code: Complete workflow code to execute
             user_input: Input data for the workflow
             attached_file_ids: Optional list of file IDs attached to this execution
+            attached_file_infos: Optional pre-fetched metadata for the attached files
         
         Returns:
             WorkflowExecution object with results
@@ -99,7 +115,7 @@ class WorkflowExecutor:
         
         try:
             # Execute the workflow code
-            result = await self._execute_code_safely(code, user_input, attached_file_ids)
+            result = await self._execute_code_safely(code, user_input, attached_file_ids, attached_file_infos)
             execution_time = time.time() - start_time
             
             execution.mark_completed(result, execution_time)
@@ -115,7 +131,13 @@ class WorkflowExecutor:
         
         return execution
     
-    async def _execute_code_safely(self, code: str, user_input: str, attached_file_ids: Optional[List[int]] = None) -> str:
+    async def _execute_code_safely(
+        self,
+        code: str,
+        user_input: str,
+        attached_file_ids: Optional[List[int]] = None,
+        attached_file_infos: Optional[List[Dict[str, Any]]] = None
+    ) -> str:
         """
         Safely execute the generated workflow code with timeout
         
@@ -123,19 +145,17 @@ class WorkflowExecutor:
             code: The complete self-contained Python code to execute
             user_input: Input for the workflow
             attached_file_ids: Optional list of attached file IDs
+            attached_file_infos: Optional pre-fetched metadata for the attached files
         
         Returns:
             The result from the workflow execution
         """
         # Create execution environment with API keys injected
-        execution_globals = self._create_execution_environment(attached_file_ids)
+        execution_globals = self._create_execution_environment(attached_file_ids, attached_file_infos)
         
         try:
-            # Inject actual API keys into the code
-            code = self._inject_api_keys(code)
-            
-            # Compile the code
-            compiled_code = compile(code, '<workflow>', 'exec')
+            # Inject actual API keys and compile (reused across runs of the same code)
+            compiled_code = self._compile_workflow_code(code)
             
             # Execute with timeout
             result = await asyncio.wait_for(
@@ -150,7 +170,20 @@ class WorkflowExecutor:
         except Exception as e:
             raise Exception(f"Workflow execution failed: {str(e)}")
     
-    def _inject_api_keys(self, code: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _compile_workflow_code(code: str) -> CodeType:
+        """
+        Inject API keys and compile workflow code, cached by source text
+        
+        Workflows are usually executed many times with the same code, so the
+        bytecode is reused instead of being re-parsed on every run. Keying on
+        the source means code replaced by feedback is compiled afresh.
+        """
+        return compile(WorkflowExecutor._inject_api_keys(code), '<workflow>', 'exec')
+    
+    @staticmethod
+    def _inject_api_keys(code: str) -> str:
         """
         Inject actual API keys into the generated code
         """
@@ -226,7 +259,11 @@ class WorkflowExecutor:
                 raise Exception(f"{str(e)}. Stderr: {stderr_content}")
             raise e
     
-    def _create_execution_environment(self, attached_file_ids: Optional[List[int]] = None) -> Dict[str, Any]:
+    def _create_execution_environment(
+        self,
+        attached_file_ids: Optional[List[int]] = None,
+        attached_file_infos: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
         Create a minimal execution environment for self-contained code
         
@@ -307,6 +344,10 @@ class WorkflowExecutor:
             restricted_globals['attached_file_ids'] = attached_file_ids
             restricted_globals['ATTACHED_FILES'] = attached_file_ids  # Also provide as constant
         
+        # Metadata already fetched while validating the attachments
+        if attached_file_infos:
+            restricted_globals['attached_file_infos'] = attached_file_infos
+        
         return restricted_globals
 
 
@@ -1,62 +1,24 @@
+import ast
 import asyncio
+import hashlib
 import logging
+import random
 import re
-from typing import Optional, Dict, Any
-from .models import Workflow
-from anthropic import Anthropic
+from functools import lru_cache
+from typing import Optional, Dict, Any, Awaitable, Callable, Tuple, TypeVar
+from .cache import GeneratedCodeCache, canonical_json
+from .models import Workflow, WorkflowStatus
+import anthropic
+from anthropic import AsyncAnthropic
 from ..config import settings
 
 logger = logging.getLogger(__name__)
 
-
-class WorkflowGenerator:
-    def __init__(self):
-        self.anthropic_client = Anthropic(api_key=settings.anthropic_api_key)
-
-    async def generate_workflow(
-        self,
-        description: str,
-        name: Optional[str] = None,
-        context: Optional[Dict[str, Any]] = None
-    ) -> Workflow:
-        """
-        Generate a workflow from a natural language description
-        Args:
-            description: Natural language description of the workflow
-            name: Optional name for the workflow
-            context: Additional context for code generation
-        Returns:
-            Workflow object with generated code
-        """
-        workflow = Workflow(
-            name=name,
-            description=description,
-            context=context
-        )
-        
-        try:
-            workflow.update_status("generating")
-            # Generate the code using Anthropic API
-            generated_code = await self._generate_code(description, context)
-            
-            # Validate the generated code
-            validation_result = await self._validate_code(generated_code)
-            if not validation_result["valid"]:
-                raise Exception(f"Generated code validation failed: {validation_result['error']}")
-            
-            workflow.generated_code = generated_code
-            workflow.update_status("ready")
-            return workflow
-            
-        except Exception as e:
-            workflow.update_status("failed", str(e))
-            raise e
-
-    async def _generate_code(self, description: str, context: Optional[Dict[str, Any]] = None) -> str:
-        """
-        Generate Python code from workflow description
-        """
-        system_prompt = """You are a Python code generator for workflow automation systems.
+# Static system prompt for code generation.
+# Kept as a module-level constant so its bytes are identical on every call:
+# it is sent with cache_control so Anthropic serves it from the prompt cache,
+# and any change to this text invalidates the cached prefix.
+_CODE_GENERATION_SYSTEM_PROMPT = """You are a Python code generator for workflow automation systems.
 
 CRITICAL INSTRUCTIONS:
 1. Generate ONLY executable Python code - no markdown, no explanations, no comments
@@ -73,6 +35,8 @@ import asyncio
 import aiohttp
 import json
 import logging
+import random
+import orjson
 from typing import Optional, List, Dict, Any
 
 # Configuration - replace with your actual values
@@ -89,56 +53,73 @@ class ParadigmClient:
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}"
         }
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        # One pooled session per client: reuses TCP/TLS connections across calls
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=60),
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
     
     async def document_search(self, query: str, **kwargs) -> Dict[str, Any]:
         endpoint = f"{self.base_url}/api/v2/chat/document-search"
         payload = {"query": query, **kwargs}
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(endpoint, json=payload, headers=self.headers) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    raise Exception(f"API error {response.status}: {await response.text()}")
+        session = await self._get_session()
+        async with session.post(endpoint, json=payload, headers=self.headers) as response:
+            if response.status == 200:
+                return orjson.loads(await response.read())
+            else:
+                raise Exception(f"API error {response.status}: {await response.text()}")
     
     async def analyze_documents_with_polling(self, query: str, document_ids: List[int], **kwargs) -> str:
         # Start analysis
         endpoint = f"{self.base_url}/api/v2/chat/document-analysis"
         payload = {"query": query, "document_ids": document_ids, **kwargs}
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(endpoint, json=payload, headers=self.headers) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    chat_response_id = result.get("chat_response_id")
-                else:
-                    raise Exception(f"Analysis API error {response.status}: {await response.text()}")
+        session = await self._get_session()
+        async with session.post(endpoint, json=payload, headers=self.headers) as response:
+            if response.status == 200:
+                result = orjson.loads(await response.read())
+                chat_response_id = result.get("chat_response_id")
+            else:
+                raise Exception(f"Analysis API error {response.status}: {await response.text()}")
         
-        # Poll for results
+        # Poll for results with exponential backoff and jitter
         max_wait = 300  # 5 minutes
-        poll_interval = 5
-        elapsed = 0
+        delay = 0.5
+        elapsed = 0.0
         
         while elapsed < max_wait:
             endpoint = f"{self.base_url}/api/v2/chat/document-analysis/{chat_response_id}"
-            async with aiohttp.ClientSession() as session:
-                async with session.get(endpoint, headers=self.headers) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        status = result.get("status", "")
-                        if status.lower() in ["completed", "complete", "finished", "success"]:
-                            analysis_result = result.get("result") or result.get("detailed_analysis") or "Analysis completed"
-                            return analysis_result
-                        elif status.lower() in ["failed", "error"]:
-                            raise Exception(f"Analysis failed: {status}")
-                    elif response.status == 404:
-                        # Analysis not ready yet, continue polling
-                        pass
-                    else:
-                        raise Exception(f"Polling API error {response.status}: {await response.text()}")
-                    
-                    await asyncio.sleep(poll_interval)
-                    elapsed += poll_interval
+            session = await self._get_session()
+            async with session.get(endpoint, headers=self.headers) as response:
+                if response.status == 200:
+                    result = orjson.loads(await response.read())
+                    status = result.get("status", "")
+                    if status.lower() in ["completed", "complete", "finished", "success"]:
+                        analysis_result = result.get("result") or result.get("detailed_analysis") or "Analysis completed"
+                        return analysis_result
+                    elif status.lower() in ["failed", "error"]:
+                        raise Exception(f"Analysis failed: {status}")
+                elif response.status == 404:
+                    # Analysis not ready yet, continue polling
+                    pass
+                else:
+                    raise Exception(f"Polling API error {response.status}: {await response.text()}")
+            
+            wait = delay + delay * random.uniform(-0.2, 0.2)
+            await asyncio.sleep(wait)
+            elapsed += wait
+            delay = min(delay * 1.5, 10.0)
         
         raise Exception("Analysis timed out")
     
@@ -152,13 +133,13 @@ class ParadigmClient:
             ]
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(endpoint, json=payload, headers=self.headers) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result["choices"][0]["message"]["content"]
-                else:
-                    raise Exception(f"Paradigm chat completion API error {response.status}: {await response.text()}")
+        session = await self._get_session()
+        async with session.post(endpoint, json=payload, headers=self.headers) as response:
+            if response.status == 200:
+                result = orjson.loads(await response.read())
+                return result["choices"][0]["message"]["content"]
+            else:
+                raise Exception(f"Paradigm chat completion API error {response.status}: {await response.text()}")
     
     async def analyze_image(self, query: str, document_ids: List[str], model: str = None, private: bool = False) -> str:
         endpoint = f"{self.base_url}/api/v2/chat/image-analysis"
@@ -171,25 +152,29 @@ class ParadigmClient:
         if private is not None:
             payload["private"] = private
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(endpoint, json=payload, headers=self.headers) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result.get("answer", "No analysis result provided")
-                else:
-                    raise Exception(f"Image analysis API error {response.status}: {await response.text()}")
+        session = await self._get_session()
+        async with session.post(endpoint, json=payload, headers=self.headers) as response:
+            if response.status == 200:
+                result = orjson.loads(await response.read())
+                return result.get("answer", "No analysis result provided")
+            else:
+                raise Exception(f"Image analysis API error {response.status}: {await response.text()}")
 
 # Initialize clients
 paradigm_client = ParadigmClient(LIGHTON_API_KEY, LIGHTON_BASE_URL)
 
 async def execute_workflow(user_input: str) -> str:
-    # Your workflow implementation here
-    pass
+    try:
+        # Your workflow implementation here
+        pass
+    finally:
+        await paradigm_client.close()
 ```
 
 IMPORTANT LIBRARY RESTRICTIONS:
-- Only use built-in Python libraries (asyncio, json, logging, typing, re, etc.)
+- Only use built-in Python libraries (asyncio, json, logging, random, typing, re, etc.)
 - Only use aiohttp for HTTP requests (already included in template)
+- Use orjson for JSON encoding/decoding of API payloads (already included in template)
 - DO NOT import external libraries like nltk, requests, pandas, numpy, etc.
 
 CRITICAL: AVOID VARIABLE SCOPING ERRORS
@@ -225,6 +210,7 @@ When creating prompts for API calls, include relevant context from the original
 
 WORKFLOW ACCESS TO ATTACHED FILES:
 - Get attached files with: attached_file_ids = globals().get('attached_file_ids', [])
+- File metadata (id, filename, status) is already available with: attached_file_infos = globals().get('attached_file_infos', []) - do not re-fetch it
 - Pass these IDs to file_ids parameter in document_search
 - For document analysis: use attached_file_ids directly as document IDs
 - Extract document IDs from search results for analysis ONLY when searching, not when using attached files
@@ -322,10 +308,11 @@ answer = search_result["documents"][0].get("content", "")  # Raw content extract
 Generate the complete self-contained workflow code that implements the exact logic described.
 
 CRITICAL: NO PLACEHOLDER CODE - NEVER use 'pass' statements, NEVER use placeholder comments, EVERY function must be fully implemented with working code, ALL code must be ready to execute immediately."""
-        
-        enhanced_description = f"""
+
+# Per-request user message for code generation, filled with str.format
+_CODE_REQUEST_TEMPLATE = """
 Workflow Description: {description}
-Additional Context: {context or 'None'}
+Additional Context: {context}
 
 Generate a complete, self-contained workflow that:
 1. Includes all necessary imports and API client classes
@@ -333,70 +320,9 @@ Generate a complete, self-contained workflow that:
 3. Can be copy-pasted and run independently on any server
 4. Handles the workflow requirements exactly as specified
 """
-        
-        try:
-            response = self.anthropic_client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=18000,  # Increased for full code generation
-                temperature=0,  # For reproducible results
-                system=system_prompt,
-                messages=[{"role": "user", "content": enhanced_description}]
-            )
-            
-            code = response.content[0].text
-            
-            # Log the raw generated code for debugging
-            logger.info("🔧 RAW GENERATED CODE:")
-            logger.info("=" * 50)
-            logger.info(code)
-            logger.info("=" * 50)
-            
-            # Clean up the code - remove markdown formatting if present
-            code = self._clean_generated_code(code)
-            
-            # Log the cleaned code for debugging
-            logger.info("🔧 CLEANED GENERATED CODE:")
-            logger.info("=" * 50)
-            logger.info(code)
-            logger.info("=" * 50)
-            
-            return code
-            
-        except Exception as e:
-            raise Exception(f"Code generation failed: {str(e)}")
 
-
-    def _clean_generated_code(self, code: str) -> str:
-        """
-        Clean up generated code by removing markdown formatting and ensuring proper structure
-        """
-        # Remove markdown code blocks
-        if "```python" in code:
-            code = code.split("```python")[1].split("```")[0]
-        elif "```" in code:
-            code = code.split("```")[1].split("```")[0]
-        
-        # Remove leading/trailing whitespace
-        code = code.strip()
-        
-        # Ensure execute_workflow is async
-        if "def execute_workflow(" in code and "async def execute_workflow(" not in code:
-            code = code.replace("def execute_workflow(", "async def execute_workflow(")
-        
-        return code
-
-    async def enhance_workflow_description(self, raw_description: str) -> Dict[str, Any]:
-        """
-        Enhance a raw workflow description using Claude AI to create a more detailed,
-        actionable workflow specification with proper tool usage and clear steps.
-        
-        Args:
-            raw_description: User's initial natural language workflow description
-            
-        Returns:
-            Dict containing enhanced description, questions, and warnings
-        """
-        enhancement_prompt = """You are an AI assistant that helps users create detailed workflow descriptions for automation systems.
+# System prompt for enhance_workflow_description
+_ENHANCEMENT_SYSTEM_PROMPT = """You are an AI assistant that helps users create detailed workflow descriptions for automation systems.
 
 Your task is to analyze the user's raw workflow description and enhance it into a extremely clear, precise and detailed workflow specification that can be effectively implemented using the available Paradigm API tools.
 
@@ -454,7 +380,7 @@ LIMITATIONS TO CHECK FOR:
 - Web searching is NOT available - only document searching within Paradigm
 - External API calls (except Paradigm) are NOT available, unless full documentation for these is provided by the user in their initial description
 - Complex data processing libraries (pandas, numpy, etc.) are NOT available - try to avoid them if possible, if you do need these, clearly specify what imports are needed in the step description
-- Only built-in Python libraries and aiohttp are available
+- Only built-in Python libraries, aiohttp and orjson are available
 
 OUTPUT FORMAT:
 CRITICAL: Provide your response as PLAIN TEXT ONLY, in a format that will be easy to understand for an LLM.
@@ -504,16 +430,337 @@ QUESTIONS AND LIMITATIONS: None
 
 Now enhance this workflow description and return ONLY the plain text response:"""
 
+# Cache namespace: cached code is only reused while the system prompt is unchanged
+_PROMPT_VERSION = hashlib.sha256(_CODE_GENERATION_SYSTEM_PROMPT.encode("utf-8")).hexdigest()[:16]
+
+_LOG_RULE = "=" * 50
+
+# Attempts per Anthropic request on rate-limit/overload/server/connection
+# errors, with jittered exponential backoff between them. The SDK client's own
+# retries are disabled so the two do not multiply.
+_ANTHROPIC_MAX_ATTEMPTS = 4
+_RETRYABLE_ANTHROPIC_ERRORS = (
+    anthropic.RateLimitError,
+    anthropic.OverloadedError,
+    anthropic.InternalServerError,
+    anthropic.APIConnectionError,
+)
+
+T = TypeVar("T")
+
+# Modules every generated workflow must import
+_REQUIRED_IMPORTS = ('asyncio', 'aiohttp', 'json', 'orjson')
+
+# Common error patterns in generated code, logged as warnings only
+_CODE_WARNING_PATTERNS = (
+    (re.compile('if.*:\\s*\\n.*=.*await.*\\n.*f.*{.*}', re.DOTALL), 'Potential UnboundLocalError: variable defined only in conditional block'),
+    (re.compile('json\\.loads\\([^)]+\\)(?!.*except)', re.DOTALL), 'Missing error handling for JSON parsing'),
+    (re.compile('await.*\\.get\\(.*\\).*f.*{.*}.*(?!except)', re.DOTALL), 'API result used in f-string without null check')
+)
+
+@lru_cache(maxsize=512)
+def _check_generated_code(code: str) -> Tuple[bool, Optional[str], Tuple[str, ...]]:
+    """
+    Check generated code for syntax, the async entry point and required imports.
+    
+    Pure function of the code string, so results are memoized; identical code
+    validated again (e.g. across feedback iterations) is not re-parsed.
+    Pattern warnings are returned rather than logged here, so callers log them
+    on every validation and not only on a cache miss.
+    
+    Returns:
+        Tuple of (valid, error message or None, pattern warnings)
+    """
+    try:
+        # Basic syntax check (parse only, no bytecode generation)
+        tree = ast.parse(code, mode='exec')
+        
+        # Single pass over top-level statements for the entry point and imports
+        imported_modules = set()
+        execute_workflow_node = None
+        for node in tree.body:
+            if isinstance(node, ast.Import):
+                imported_modules.update(alias.name.split('.')[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                imported_modules.add(node.module.split('.')[0])
+            elif isinstance(node, (ast.AsyncFunctionDef, ast.FunctionDef)) and node.name == 'execute_workflow':
+                execute_workflow_node = node
+        
+        # Required function check
+        if execute_workflow_node is None:
+            return False, "Missing execute_workflow function", ()
+        
+        if not isinstance(execute_workflow_node, ast.AsyncFunctionDef):
+            return False, "execute_workflow must be async", ()
+        
+        # Required imports check
+        missing_imports = [f"import {module}" for module in _REQUIRED_IMPORTS if module not in imported_modules]
+        
+        if missing_imports:
+            return False, f"Missing required imports: {', '.join(missing_imports)}", ()
+        
+        # Common error pattern detection; these don't fail validation
+        warnings = tuple(warning for pattern, warning in _CODE_WARNING_PATTERNS if pattern.search(code))
+        
+        return True, None, warnings
+        
+    except SyntaxError as e:
+        return False, f"Syntax error at line {e.lineno}: {e.msg}", ()
+    except Exception as e:
+        return False, f"Validation error: {str(e)}", ()
+
+_FENCE_RE = re.compile(r"```(?:python)?[^\S\n]*\n?(.*?)(?:```|\Z)", re.DOTALL)
+_SYNC_EXECUTE_WORKFLOW_RE = re.compile(r"(?<!async )\bdef execute_workflow\(")
+
+
+class WorkflowGenerator:
+    def __init__(self, anthropic_client: Optional[AsyncAnthropic] = None):
+        # The SDK client owns an HTTP connection pool; callers may share one
+        self.anthropic_client = anthropic_client or AsyncAnthropic(
+            api_key=settings.anthropic_api_key,
+            max_retries=0  # retries are owned by run_anthropic_request
+        )
+        self.code_cache = GeneratedCodeCache()
+        # Caps concurrent Anthropic requests from this process
+        self.anthropic_sem = asyncio.Semaphore(settings.anthropic_max_concurrency)
+        # Pending generations keyed by request, shared by concurrent identical calls
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def run_anthropic_request(self, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run an Anthropic request under the concurrency limit, with retries.
+        
+        Args:
+            call: Zero-argument callable creating a fresh request coroutine per attempt
+            
+        Returns:
+            The result of the first successful attempt
+            
+        Raises:
+            The last rate-limit or server error once attempts are exhausted;
+            other errors are raised immediately
+        """
+        async with self.anthropic_sem:
+            for attempt in range(_ANTHROPIC_MAX_ATTEMPTS):
+                try:
+                    return await call()
+                except _RETRYABLE_ANTHROPIC_ERRORS as e:
+                    if attempt == _ANTHROPIC_MAX_ATTEMPTS - 1:
+                        raise
+                    delay = min(2 ** attempt, 30) * random.uniform(0.8, 1.2)
+                    logger.warning("Anthropic request failed (%s), retrying in %.1fs", e, delay)
+                    await asyncio.sleep(delay)
+
+    async def generate_workflow(
+        self,
+        description: str,
+        name: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Workflow:
+        """
+        Generate a workflow from a natural language description
+        Args:
+            description: Natural language description of the workflow
+            name: Optional name for the workflow
+            context: Additional context for code generation
+        Returns:
+            Workflow object with generated code
+            
+        Note:
+            Concurrent calls with the same description, name and context share
+            a single generation and receive the same Workflow object.
+        """
+        request_key = hashlib.sha256(
+            "|".join((description, name or "")).encode("utf-8") + b"|" + canonical_json(context)
+        ).hexdigest()
+        
+        task = self._inflight.get(request_key)
+        if task is None:
+            task = asyncio.ensure_future(self._generate_workflow(description, name, context))
+            self._inflight[request_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(request_key, None))
+        
+        # Shield so one caller disconnecting does not cancel the shared generation
+        return await asyncio.shield(task)
+
+    async def _generate_workflow(
+        self,
+        description: str,
+        name: Optional[str],
+        context: Optional[Dict[str, Any]]
+    ) -> Workflow:
+        """Run a single workflow generation; see generate_workflow."""
+        workflow = Workflow(
+            name=name,
+            description=description,
+            context=context
+        )
+        
+        try:
+            workflow.update_status(WorkflowStatus.GENERATING)
+            
+            # Identical requests reuse previously validated code
+            cache_key = self.code_cache.make_key(_PROMPT_VERSION, description, context)
+            cached_code = self.code_cache.get(cache_key)
+            if cached_code is not None:
+                logger.info("Generated code cache hit")
+                workflow.generated_code = cached_code
+                workflow.update_status(WorkflowStatus.READY)
+                return workflow
+            
+            # Generate the code using Anthropic API
+            generated_code = await self._generate_code(description, context, settings.generator_model)
+            
+            # Validate the generated code, retrying once with the fallback model.
+            # Parsing multi-KB code is CPU work, so it runs in a worker thread.
+            validation_result = await asyncio.to_thread(self._validate_code, generated_code)
+            if not validation_result["valid"] and settings.generator_fallback_model != settings.generator_model:
+                logger.warning(
+                    "Code from %s failed validation (%s), retrying with %s",
+                    settings.generator_model, validation_result["error"], settings.generator_fallback_model
+                )
+                generated_code = await self._generate_code(description, context, settings.generator_fallback_model)
+                validation_result = await asyncio.to_thread(self._validate_code, generated_code)
+            if not validation_result["valid"]:
+                raise Exception(f"Generated code validation failed: {validation_result['error']}")
+            
+            self.code_cache.set(cache_key, generated_code)
+            workflow.generated_code = generated_code
+            workflow.update_status(WorkflowStatus.READY)
+            return workflow
+            
+        except Exception as e:
+            workflow.update_status(WorkflowStatus.FAILED, str(e))
+            raise e
+
+    async def _generate_code(
+        self,
+        description: str,
+        context: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None
+    ) -> str:
+        """
+        Generate Python code from workflow description
+        
+        Uses settings.generator_model unless another model is given.
+        """
+        enhanced_description = _CODE_REQUEST_TEMPLATE.format(
+            description=description,
+            context=context or 'None'
+        )
+        
+        try:
+            model = model or settings.generator_model
+            code = await self.run_anthropic_request(lambda: self._stream_code(enhanced_description, model))
+            
+            # Log the raw generated code for debugging
+            debug_logging = logger.isEnabledFor(logging.INFO)
+            if debug_logging:
+                logger.info("🔧 RAW GENERATED CODE:\n%s\n%s\n%s", _LOG_RULE, code, _LOG_RULE)
+            
+            # Clean up the code - remove markdown formatting if present
+            code = self._clean_generated_code(code)
+            
+            # Log the cleaned code for debugging
+            if debug_logging:
+                logger.info("🔧 CLEANED GENERATED CODE:\n%s\n%s\n%s", _LOG_RULE, code, _LOG_RULE)
+            
+            return code
+            
+        except Exception as e:
+            raise Exception(f"Code generation failed: {str(e)}")
+
+
+    async def _stream_code(self, enhanced_description: str, model: str) -> str:
+        """
+        Stream one code generation response from model and return the raw text.
+        """
+        chunks = []
+        fences_seen = 0
+        tail = ""
+        async with self.anthropic_client.messages.stream(
+            model=model,
+            max_tokens=18000,  # Increased for full code generation
+            temperature=0,  # For reproducible results
+            # Only cached on models whose minimum cacheable prefix this prompt
+            # reaches (~3.6k tokens: Sonnet 4 yes, Haiku 4.5 no)
+            system=[{
+                "type": "text",
+                "text": _CODE_GENERATION_SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"}
+            }],
+            messages=[{"role": "user", "content": enhanced_description}]
+        ) as stream:
+            async for text in stream.text_stream:
+                chunks.append(text)
+                # Count fences across chunk boundaries; once the code block
+                # is closed, anything after it is discarded by the cleanup
+                # step, so stop receiving instead of waiting for it
+                fences_seen += (tail + text).count("```")
+                if fences_seen >= 2:
+                    break
+                tail = (tail + text)[-2:]
+            
+            usage = stream.current_message_snapshot.usage
+        
+        cache_read = getattr(usage, "cache_read_input_tokens", None)
+        cache_written = getattr(usage, "cache_creation_input_tokens", None)
+        if cache_read or cache_written:
+            logger.info(
+                "Code generation prompt cache (%s): %s tokens read, %s tokens written",
+                model, cache_read, cache_written
+            )
+        else:
+            logger.info(
+                "Code generation prompt cache not used by %s "
+                "(system prompt may be below the model's minimum cacheable length)",
+                model
+            )
+        
+        return "".join(chunks)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _clean_generated_code(code: str) -> str:
+        """
+        Clean up generated code by removing markdown formatting and ensuring proper structure
+        
+        Pure function of its input, so results are memoized.
+        """
+        # Remove markdown code blocks (an unterminated fence runs to the end)
+        match = _FENCE_RE.search(code)
+        if match:
+            code = match.group(1)
+        
+        # Remove leading/trailing whitespace
+        code = code.strip()
+        
+        # Ensure execute_workflow is async (there is only one entry point to fix)
+        code = _SYNC_EXECUTE_WORKFLOW_RE.sub("async def execute_workflow(", code, count=1)
+        
+        return code
+
+    async def enhance_workflow_description(self, raw_description: str) -> Dict[str, Any]:
+        """
+        Enhance a raw workflow description using Claude AI to create a more detailed,
+        actionable workflow specification with proper tool usage and clear steps.
+        
+        Args:
+            raw_description: User's initial natural language workflow description
+            
+        Returns:
+            Dict containing enhanced description, questions, and warnings
+        """
         user_message = f"Raw workflow description: {raw_description}"
         
         try:
-            response = self.anthropic_client.messages.create(
+            response = await self.run_anthropic_request(lambda: self.anthropic_client.messages.create(
                 model="claude-opus-4-1-20250805",
                 max_tokens=8000,  # Increased for complex workflows
                 temperature=0,  # For reproducible results
-                system=enhancement_prompt,
+                system=_ENHANCEMENT_SYSTEM_PROMPT,
                 messages=[{"role": "user", "content": user_message}]
-            )
+            ))
             
             result_text = response.content[0].text.strip()
             
@@ -525,53 +772,20 @@ Now enhance this workflow description and return ONLY the plain text response:""
             }
                 
         except Exception as e:
-            logger.error(f"Failed to enhance workflow description: {str(e)}")
+            logger.error("Failed to enhance workflow description: %s", e)
             raise Exception(f"Workflow description enhancement failed: {str(e)}")
 
-    async def _validate_code(self, code: str) -> Dict[str, Any]:
+    def _validate_code(self, code: str) -> Dict[str, Any]:
         """
         Enhanced validation for generated code reliability
+        
+        Results are memoized per code string by _check_generated_code.
         """
-        try:
-            # Basic syntax check
-            compile(code, '<string>', 'exec')
-            
-            # Required function check
-            if 'def execute_workflow(' not in code:
-                return {"valid": False, "error": "Missing execute_workflow function"}
-            
-            if 'async def execute_workflow(' not in code:
-                return {"valid": False, "error": "execute_workflow must be async"}
-            
-            # Required imports check
-            required_imports = ['import asyncio', 'import aiohttp', 'import json']
-            missing_imports = []
-            for imp in required_imports:
-                if imp not in code:
-                    missing_imports.append(imp)
-            
-            if missing_imports:
-                return {"valid": False, "error": f"Missing required imports: {', '.join(missing_imports)}"}
-            
-            # Common error pattern detection
-            error_patterns = [
-                ('if.*:\\s*\\n.*=.*await.*\\n.*f.*{.*}', 'Potential UnboundLocalError: variable defined only in conditional block'),
-                ('json\\.loads\\([^)]+\\)(?!.*except)', 'Missing error handling for JSON parsing'),
-                ('await.*\\.get\\(.*\\).*f.*{.*}.*(?!except)', 'API result used in f-string without null check')
-            ]
-            
-            for pattern, warning in error_patterns:
-                if re.search(pattern, code, re.DOTALL):
-                    # Don't fail validation, but log warning
-                    logger.warning(f"Code pattern warning: {warning}")
-            
-            return {"valid": True, "error": None}
-            
-        except SyntaxError as e:
-            return {"valid": False, "error": f"Syntax error at line {e.lineno}: {e.msg}"}
-        except Exception as e:
-            return {"valid": False, "error": f"Validation error: {str(e)}"}
-
-
-# Global generator instance
-workflow_generator = WorkflowGenerator()
\ No newline at end of file
+        valid, error, warnings = _check_generated_code(code)
+        for warning in warnings:
+            logger.warning("Code pattern warning: %s", warning)
+        return {"valid": valid, "error": error}
+
+    async def close(self) -> None:
+        """Close the Anthropic client's connection pool."""
+        await self.anthropic_client.close()
\ No newline at end of file
@@ -4,13 +4,15 @@ Workflow Domain Models
 This module defines the core domain models for the workflow system:
 - Workflow: Represents a workflow with generated code and metadata
 - WorkflowExecution: Tracks individual workflow execution instances
+- WorkflowStatus: Enumeration of possible workflow states
 - ExecutionStatus: Enumeration of possible execution states
 - CodeGenerationContext: Context for code generation operations
 
 Key Features:
-    - Dataclass-based models for immutability and type safety
+    - Slotted dataclass models for type safety and a small memory footprint
     - UUID-based unique identifiers
     - Comprehensive status tracking with timestamps
+    - Timestamps stored as integer epoch nanoseconds, converted on access
     - Execution timing and error handling
     - Context management for code generation
 
@@ -20,12 +22,36 @@ Architecture:
     - Comprehensive metadata tracking for debugging and monitoring
 """
 
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, field
 from enum import Enum
 import uuid
 
+def _ns_to_datetime(ns: int) -> datetime:
+    """Convert epoch nanoseconds to a naive UTC datetime."""
+    return datetime.fromtimestamp(ns / 1e9, timezone.utc).replace(tzinfo=None)
+
+class WorkflowStatus(str, Enum):
+    """
+    Enumeration of possible workflow status values.
+    
+    States:
+        CREATED: Workflow has been created but code generation hasn't started
+        GENERATING: AI is currently generating code for the workflow
+        READY: Code generation complete, workflow ready for execution
+        EXECUTING: Workflow is currently being executed
+        COMPLETED: Workflow execution completed successfully
+        FAILED: Workflow creation or execution failed
+    """
+    CREATED = "created"
+    GENERATING = "generating"
+    READY = "ready"
+    EXECUTING = "executing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
 class ExecutionStatus(str, Enum):
     """
     Enumeration of workflow execution status values.
@@ -43,7 +69,7 @@ class ExecutionStatus(str, Enum):
     FAILED = "failed"
     TIMEOUT = "timeout"
 
-@dataclass
+@dataclass(slots=True)
 class Workflow:
     """
     Represents a workflow with AI-generated code and metadata.
@@ -53,27 +79,37 @@ class Workflow:
     times with different inputs.
     
     Attributes:
-        id: Unique identifier (UUID)
+        id: Unique identifier (32-character UUID hex)
         name: Optional human-readable name
         description: Natural language description provided by user
         generated_code: AI-generated Python code for execution
-        status: Current workflow status
-        created_at: Timestamp of creation
-        updated_at: Timestamp of last modification
+        status: Current workflow status (WorkflowStatus member)
+        created_at_ns: Creation time in epoch nanoseconds
+        updated_at_ns: Time of last modification in epoch nanoseconds
         error: Error message if workflow creation failed
         context: Additional context used during code generation
     """
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
     name: Optional[str] = None
     description: str = ""
     generated_code: Optional[str] = None
-    status: str = "created"
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    status: WorkflowStatus = WorkflowStatus.CREATED
+    created_at_ns: int = field(default_factory=time.time_ns)
+    updated_at_ns: int = field(default_factory=time.time_ns)
     error: Optional[str] = None
     context: Optional[Dict[str, Any]] = None
     
-    def update_status(self, status: str, error: Optional[str] = None):
+    @property
+    def created_at(self) -> datetime:
+        """Timestamp of creation as a naive UTC datetime."""
+        return _ns_to_datetime(self.created_at_ns)
+    
+    @property
+    def updated_at(self) -> datetime:
+        """Timestamp of last modification as a naive UTC datetime."""
+        return _ns_to_datetime(self.updated_at_ns)
+    
+    def update_status(self, status: WorkflowStatus, error: Optional[str] = None):
         """
         Update workflow status and timestamp.
         
@@ -81,15 +117,19 @@ class Workflow:
         and optionally records an error message.
         
         Args:
-            status: New status value
+            status: New status; plain strings are normalized to the enum member,
+                so status checks elsewhere can compare by identity
             error: Optional error message to record
+            
+        Raises:
+            ValueError: If status is not a valid WorkflowStatus value
         """
-        self.status = status
-        self.updated_at = datetime.utcnow()
+        self.status = WorkflowStatus(status)
+        self.updated_at_ns = time.time_ns()
         if error:
             self.error = error
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowExecution:
     """
     Represents a single execution instance of a workflow.
@@ -98,25 +138,37 @@ class WorkflowExecution:
     including results, timing, and any errors that occurred.
     
     Attributes:
-        id: Unique execution identifier (UUID)
+        id: Unique execution identifier (32-character UUID hex)
         workflow_id: ID of the parent workflow
         user_input: Input provided by user for this execution
         result: Execution result or None if not completed
         status: Current execution status
         execution_time: Time taken to execute (seconds)
         error: Error message if execution failed
-        created_at: Timestamp when execution started
-        completed_at: Timestamp when execution finished (if applicable)
+        created_at_ns: Execution start time in epoch nanoseconds
+        completed_at_ns: Completion time in epoch nanoseconds (if applicable)
     """
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
     workflow_id: str = ""
     user_input: str = ""
     result: Optional[str] = None
     status: ExecutionStatus = ExecutionStatus.PENDING
     execution_time: Optional[float] = None
     error: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    completed_at: Optional[datetime] = None
+    created_at_ns: int = field(default_factory=time.time_ns)
+    completed_at_ns: Optional[int] = None
+    
+    @property
+    def created_at(self) -> datetime:
+        """Timestamp when execution started as a naive UTC datetime."""
+        return _ns_to_datetime(self.created_at_ns)
+    
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        """Timestamp when execution finished as a naive UTC datetime, if it has."""
+        if self.completed_at_ns is None:
+            return None
+        return _ns_to_datetime(self.completed_at_ns)
     
     def mark_completed(self, result: str, execution_time: float):
         """
@@ -132,7 +184,7 @@ class WorkflowExecution:
         self.result = result
         self.status = ExecutionStatus.COMPLETED
         self.execution_time = execution_time
-        self.completed_at = datetime.utcnow()
+        self.completed_at_ns = time.time_ns()
     
     def mark_failed(self, error: str, execution_time: Optional[float] = None):
         """
@@ -148,9 +200,9 @@ class WorkflowExecution:
         self.error = error
         self.status = ExecutionStatus.FAILED
         self.execution_time = execution_time
-        self.completed_at = datetime.utcnow()
+        self.completed_at_ns = time.time_ns()
 
-@dataclass
+@dataclass(slots=True)
 class CodeGenerationContext:
     """
     Context information for AI code generation.
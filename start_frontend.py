@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Frontend Server Script
+
+This script serves the static frontend (index.html, file-workflow.html and
+logos) from the project root for local development.
+
+Features:
+    - Serves the frontend on http://127.0.0.1:3000 (local machine only)
+    - Serves only the allow-listed frontend assets, never .env or source files
+    - Handles concurrent asset requests, one thread per request
+    - Fixed MIME type table for the file types the frontend uses
+    - Clean shutdown with Ctrl+C
+
+Usage:
+    python start_frontend.py
+
+    Then open http://localhost:3000 (the backend must be running on port 8000)
+
+Architecture:
+    - http.server.ThreadingHTTPServer so assets load in parallel
+    - SimpleHTTPRequestHandler rooted at the project directory, restricted
+      to an allow-list because that directory also holds .env and the backend
+"""
+import urllib.parse
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import MappingProxyType
+
+HOST = "127.0.0.1"
+PORT = 3000
+FRONTEND_DIR = Path(__file__).parent
+
+# URL paths that may be served; everything else in the project root is refused
+_ALLOWED_PATHS = frozenset({
+    "/",
+    "/index.html",
+    "/file-workflow.html",
+    "/lighton-logo.png",
+    "/ybak-logo.png",
+})
+
+# Resolved once at import time; extensions listed here skip the mimetypes lookup
+_EXTENSIONS_MAP = MappingProxyType({
+    **SimpleHTTPRequestHandler.extensions_map,
+    ".html": "text/html",
+    ".png": "image/png",
+})
+
+class FrontendRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler limited to the frontend assets, with a read-only MIME table."""
+    extensions_map = _EXTENSIONS_MAP
+    
+    def send_head(self):
+        # Shared by GET and HEAD; anything off the allow-list gets a 404
+        path = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path)
+        if path not in _ALLOWED_PATHS:
+            self.send_error(404, "File not found")
+            return None
+        return super().send_head()
+
+def start_frontend():
+    """
+    Serve the frontend directory until interrupted.
+
+    Binds to HOST:PORT and serves the allow-listed files from the project
+    root, where index.html lives.
+    """
+    handler = partial(FrontendRequestHandler, directory=str(FRONTEND_DIR))
+
+    with ThreadingHTTPServer((HOST, PORT), handler) as httpd:
+        print(f"🌐 Frontend server running on http://localhost:{PORT}")
+        print("Press Ctrl+C to stop")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 Frontend server stopped")
+
+if __name__ == "__main__":
+    start_frontend()
@@ -8,7 +8,7 @@ clean shutdown when interrupted.
 
 Features:
     - Starts FastAPI backend on port 8000
-    - Starts frontend server on port 3000
+    - Starts frontend server on port 3000 (start_frontend.py, localhost only)
     - Handles process lifecycle management
     - Graceful shutdown with Ctrl+C
     - Process cleanup on exit
@@ -25,6 +25,7 @@ Architecture:
     - Error handling and process recovery
     - Cross-platform compatibility
 """
+import socket
 import subprocess
 import time
 import os
@@ -32,6 +33,93 @@ import signal
 import sys
 from pathlib import Path
 
+# Children run in their own session on POSIX so each can be stopped with one killpg
+_POSIX = os.name == "posix"
+
+def _spawn(args, cwd):
+    """
+    Start a child server process.
+    
+    On POSIX the child leads a new session, so it and anything it spawns
+    share one process group that _stop can signal with a single killpg.
+    """
+    return subprocess.Popen(args, cwd=cwd, start_new_session=_POSIX)
+
+def _stop(process):
+    """Send SIGTERM to a child's process group, escalating to SIGKILL after 5 seconds."""
+    if process.poll() is not None:
+        return
+    try:
+        if _POSIX:
+            os.killpg(process.pid, signal.SIGTERM)
+        else:
+            process.terminate()
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        if _POSIX:
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+        process.wait()
+    except ProcessLookupError:
+        pass
+
+def _wait_for_port(port, process, timeout=10.0):
+    """
+    Wait until something accepts TCP connections on localhost:port.
+    
+    Returns as soon as the backend has bound its listening socket, or False
+    if the process exited or the timeout elapsed first.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.1):
+                return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+def _wait_for_shutdown(processes):
+    """
+    Block until Ctrl+C, SIGTERM or the exit of any child process.
+    
+    On POSIX the signals are blocked and collected with signal.sigwait, so
+    the supervisor sleeps in the kernel instead of waking up every second.
+    Child exits are detected with Popen.poll() rather than os.waitpid(-1),
+    which would reap the children behind Popen's back.
+    
+    Args:
+        processes: Mapping of display name to Popen object
+        
+    Returns:
+        Name of the child that exited, or None if shutdown was requested
+    """
+    def exited_child():
+        return next((name for name, process in processes.items() if process.poll() is not None), None)
+    
+    if not hasattr(signal, "sigwait"):
+        # Windows: no sigwait, fall back to polling
+        try:
+            while exited_child() is None:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            return None
+        return exited_child()
+    
+    signals = {signal.SIGINT, signal.SIGTERM, signal.SIGCHLD}
+    signal.pthread_sigmask(signal.SIG_BLOCK, signals)
+    try:
+        # Checked before waiting too: a SIGCHLD sent before blocking is discarded
+        while exited_child() is None:
+            if signal.sigwait(signals) != signal.SIGCHLD:
+                return None
+        return exited_child()
+    finally:
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, signals)
+
 def start_full_system():
     """
     Start both FastAPI backend and frontend server in parallel.
@@ -42,7 +130,7 @@ def start_full_system():
     
     Process Flow:
         1. Start FastAPI backend server
-        2. Wait for backend to initialize
+        2. Wait for backend to accept connections (up to 10s)
         3. Start frontend server
         4. Monitor both processes
         5. Handle shutdown signals
@@ -72,18 +160,19 @@ def start_full_system():
         
         # Start FastAPI backend
         print("📡 Starting FastAPI backend on http://localhost:8000...")
-        backend_process = subprocess.Popen([
+        backend_process = _spawn([
             python_executable, "-m", "api.main"
         ], cwd=Path(__file__).parent)
         
-        # Wait a moment for backend to start
-        time.sleep(3)
+        # Wait for the backend to start listening
+        if not _wait_for_port(8000, backend_process):
+            print("⚠️  Backend is not accepting connections yet, starting frontend anyway")
         
-        # Start frontend server from root directory (where index.html is now located)
+        # Start frontend server (localhost only, allow-listed assets; see start_frontend.py)
         print("🌐 Starting frontend server on http://localhost:3000...")
-        frontend_process = subprocess.Popen([
-            python_executable, "-m", "http.server", "3000"
-        ], cwd=Path(__file__).parent)  # Changed from /frontend to root directory
+        frontend_process = _spawn([
+            python_executable, "start_frontend.py"
+        ], cwd=Path(__file__).parent)
         
         print("\n✅ Both servers are running!")
         print("🔗 Main UI: http://localhost:3000 (or http://localhost:8000)")
@@ -91,12 +180,11 @@ def start_full_system():
         print("📡 API docs available at http://localhost:8000/docs")
         print("\nPress Ctrl+C to stop both servers")
         
-        # Wait for interrupt
-        try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            print("\n🛑 Stopping servers...")
+        # Wait for interrupt or for either server to exit
+        exited = _wait_for_shutdown({"Backend": backend_process, "Frontend": frontend_process})
+        if exited:
+            print(f"\n⚠️  {exited} server exited unexpectedly")
+        print("\n🛑 Stopping servers...")
             
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -104,18 +192,10 @@ def start_full_system():
     finally:
         # Clean up processes
         if backend_process:
-            backend_process.terminate()
-            try:
-                backend_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                backend_process.kill()
+            _stop(backend_process)
         
         if frontend_process:
-            frontend_process.terminate()
-            try:
-                frontend_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                frontend_process.kill()
+            _stop(frontend_process)
         
         print("👋 All servers stopped")
 